@@ -18,7 +18,8 @@ async def demo_basica():
     
     # Inicializar
     print("🚀 Inicializando ORUS-MS-Agent v1.4.0...")
-    wrapper = ORUSMSAgentv1_4()
+    wrapper = ORUSMSAgentv1_4.shared()
+    await asyncio.to_thread(wrapper.warm_up)  # componentes en paralelo, fuera del event loop
     
     # Mostrar estado
     print("\n📊 Estado del Sistema:")
@@ -59,7 +60,8 @@ async def demo_avanzada():
     print("\n\n🚀 DEMOSTRACIÓN AVANZADA - Capacidades v1.4.0")
     print("=" * 50)
     
-    wrapper = ORUSMSAgentv1_4()
+    # Misma instancia que la demo básica: componentes ya construidos
+    wrapper = ORUSMSAgentv1_4.shared()
     
     # Múltiples consultas simultáneas (capacidad async)
     queries = [
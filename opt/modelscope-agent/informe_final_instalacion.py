@@ -58,6 +58,7 @@ def main():
         
         # Probar inicialización
         wrapper = ORUSMSAgentv1_4()
+        wrapper.warm_up()  # construir conectores y componentes antes de leer el estado
         print("✅ Inicialización del wrapper")
         
         # Obtener estado
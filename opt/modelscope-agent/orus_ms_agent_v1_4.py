@@ -9,7 +9,11 @@ import asyncio
 import json
 import logging
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
@@ -32,6 +36,11 @@ except ImportError as e:
     print(f"⚠️ Conectores no disponibles: {e}")
     CONNECTORS_AVAILABLE = False
 
+# Cola write-behind para los envíos a AnythingLLM y TECCIA-Z
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from write_behind_queue import DEFAULT_QUEUE_DB, WriteBehindQueue
+from rag_cache import RAGRetrievalCache
+
 # Configuración de logging
 log_dir = '/home/z/teccia-z/opt/modelscope-agent/logs'
 os.makedirs(log_dir, exist_ok=True)
@@ -46,62 +55,276 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Executor para las etapas bloqueantes (MS-Agent, RAG, MCP) y timeout por etapa
+STAGE_WORKERS = int(os.environ.get("ORUS_MS_STAGE_WORKERS", "8"))
+STAGE_TIMEOUTS = {
+    "ms_agent": float(os.environ.get("ORUS_MS_AGENT_TIMEOUT", "60")),
+    "rag": float(os.environ.get("ORUS_MS_RAG_TIMEOUT", "20")),
+    "mcp": float(os.environ.get("ORUS_MS_MCP_TIMEOUT", "10")),
+}
+
+# Segundos que se reutiliza el resultado de mcp_client.discover_tools()
+MCP_TOOLS_REFRESH = float(os.environ.get("ORUS_MCP_TOOLS_REFRESH", "300"))
+# Tras un refresco fallido se reintenta como pronto a los MCP_TOOLS_RETRY s
+MCP_TOOLS_RETRY = 30.0
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+class MCPToolIndex:
+    """
+    Índice invertido palabra clave -> herramientas MCP
+    
+    Las palabras clave de un solo token se buscan por intersección con los
+    tokens de la consulta; las de varias palabras ("estado del sistema") se
+    comprueban como subcadena, igual que antes.
+    """
+    
+    def __init__(self, tools: List[Dict[str, Any]]):
+        self.tools = tools
+        self.by_keyword = {}  # token -> índices de herramientas
+        self.phrases = []  # (frase, índice de herramienta)
+        for index, tool in enumerate(tools):
+            for keyword in tool.get('keywords', []):
+                keyword = keyword.lower()
+                if TOKEN_PATTERN.fullmatch(keyword):
+                    self.by_keyword.setdefault(keyword, set()).add(index)
+                elif keyword:
+                    self.phrases.append((keyword, index))
+    
+    def match(self, query: str) -> List[Dict[str, Any]]:
+        """Herramientas relevantes para la consulta, en el orden de descubrimiento"""
+        query = query.lower()
+        matched = set()
+        for token in set(TOKEN_PATTERN.findall(query)) & self.by_keyword.keys():
+            matched |= self.by_keyword[token]
+        for phrase, index in self.phrases:
+            if index not in matched and phrase in query:
+                matched.add(index)
+        return [self.tools[index] for index in sorted(matched)]
+
+class LazyComponent:
+    """
+    Componente del wrapper que se construye en el primer acceso
+    
+    Se usa como decorador del método que crea el componente (como
+    functools.cached_property). La construcción ocurre una sola vez aunque
+    varios hilos accedan a la vez; después el valor queda en el __dict__ de
+    la instancia y el acceso no pasa por el descriptor.
+    """
+    
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with instance._component_locks[self.name]:
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.factory(instance)
+        return instance.__dict__[self.name]
+
 class ORUSMSAgentv1_4:
     """
     Wrapper de integración entre ORUS TECCIA-Z y MS-Agent v1.4.0
     Combina lo mejor de ambos sistemas
+    
+    Los componentes (MS-Agent, RAG, conectores, cola, MCP) se crean al
+    primer uso; warm_up() los crea en paralelo por adelantado. Dentro de un
+    proceso conviene compartir una instancia con ORUSMSAgentv1_4.shared().
     """
     
-    def __init__(self):
-        """Inicializar el agente integrado"""
+    # Componentes de construcción diferida, en el orden de warm_up()
+    COMPONENTS = ("ms_agent", "config", "tool_manager", "rag_manager", "rag_cache",
+                  "anythingllm", "teccia_sync", "side_effects", "mcp_client")
+    
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, warm_up: bool = False):
+        """
+        Inicializar el agente integrado
+        
+        Args:
+            warm_up: Construir los componentes en segundo plano sin esperar
+        """
         logger.info("🚀 Inicializando ORUS-MS-Agent v1.4.0...")
         
-        # 1. Inicializar MS-Agent v1.4.0
-        self.ms_agent = LLMAgent()
-        self.config = Config()  # Configuración por defecto
-        self.tool_manager = ToolManager(config=self.config)
-        # RAG manager opcional - inicializar después si está disponible
-        self.rag_manager = None
-        try:
-            from ms_agent.rag.llama_index_rag import LlamaIndexRAG
-            # Intentar crear RAG con configuración básica
-            self.rag_manager = LlamaIndexRAG(config=self.config.config) if hasattr(self.config, 'config') else None
-        except Exception as e:
-            logger.warning(f"⚠️ RAG no disponible: {e}")
-            self.rag_manager = None
+        self._component_locks = {name: threading.Lock() for name in self.COMPONENTS}
+        self._closed = False
         
-        # 2. Inicializar conectores existentes (si están disponibles)
-        self.anythingllm = None
-        self.teccia_sync = None
+        # Las llamadas de MS-Agent, RAG y MCP son síncronas: se ejecutan en
+        # este pool para que las etapas se solapen sin bloquear el event loop
+        self.stage_executor = ThreadPoolExecutor(max_workers=STAGE_WORKERS, thread_name_prefix="orus-stage")
+        self.stage_timeouts = dict(STAGE_TIMEOUTS)
         
-        if CONNECTORS_AVAILABLE:
-            try:
-                self.anythingllm = AnythingLLMConnector()
-                logger.info("✅ AnythingLLM Connector integrado")
-            except Exception as e:
-                logger.error(f"❌ Error inicializando AnythingLLM: {e}")
-            
-            try:
-                self.teccia_sync = TECCIAZSync()
-                logger.info("✅ TECCIA-Z Sync integrado")
-            except Exception as e:
-                logger.error(f"❌ Error inicializando TECCIA-Z Sync: {e}")
+        # Herramientas MCP descubiertas (se refrescan cada MCP_TOOLS_REFRESH s)
+        self.mcp_tools_refresh = MCP_TOOLS_REFRESH
+        self._mcp_tool_index = None
+        self._mcp_tools_loaded_at = 0.0
+        self._mcp_tools_lock = threading.Lock()
         
-        # 3. Configurar MCP Client (nuevo en v1.4.0)
-        self.mcp_client = MCPClient()
-        
-        # 4. Estado del sistema
+        # Estado del sistema (el de los conectores se calcula en get_system_status)
         self.system_status = {
             "ms_agent_version": "1.4.0",
             "connectors_available": CONNECTORS_AVAILABLE,
-            "anythingllm_connected": self.anythingllm is not None,
-            "teccia_sync_connected": self.teccia_sync is not None,
             "mcp_enabled": True,
             "initialized_at": datetime.now().isoformat()
         }
         
+        if warm_up:
+            threading.Thread(target=self.warm_up, name="orus-warm-up", daemon=True).start()
+        
         logger.info(f"✅ ORUS-MS-Agent v1.4.0 inicializado: {self.system_status}")
     
+    @classmethod
+    def shared(cls, warm_up: bool = False) -> "ORUSMSAgentv1_4":
+        """
+        Instancia compartida por todo el proceso (se crea en la primera llamada)
+        
+        Si la instancia compartida se cerró con close(), se crea una nueva.
+        
+        Args:
+            warm_up: Si la instancia se crea ahora, construir sus componentes en segundo plano
+        """
+        instance = cls._shared_instance
+        if instance is None or instance._closed:
+            with cls._shared_lock:
+                instance = cls._shared_instance
+                if instance is None or instance._closed:
+                    instance = cls._shared_instance = cls(warm_up=warm_up)
+        return instance
+    
+    def warm_up(self, components: Optional[List[str]] = None, concurrent: bool = True) -> Dict[str, Any]:
+        """
+        Construir los componentes por adelantado
+        
+        Con concurrent=True se construyen a la vez en el executor de etapas;
+        los que dependen de otro (tool_manager y rag_manager de config,
+        rag_cache de rag_manager, side_effects de los conectores) lo esperan a través de su lock.
+        
+        Args:
+            components: Componentes a construir (por defecto, todos)
+            concurrent: Construirlos en paralelo
+            
+        Returns:
+            Segundos que tardó cada componente (o el error que lanzó)
+        """
+        components = list(components or self.COMPONENTS)
+        started = time.perf_counter()
+        
+        def build(name: str):
+            component_started = time.perf_counter()
+            try:
+                getattr(self, name)
+                return round(time.perf_counter() - component_started, 4)
+            except Exception as e:
+                logger.error(f"❌ Error inicializando {name}: {e}")
+                return {"error": str(e)}
+        
+        if concurrent:
+            futures = {name: self.stage_executor.submit(build, name) for name in components}
+            timings = {name: future.result() for name, future in futures.items()}
+        else:
+            timings = {name: build(name) for name in components}
+        
+        logger.info(f"🔥 Componentes listos en {time.perf_counter() - started:.2f}s: {timings}")
+        return timings
+    
+    @LazyComponent
+    def ms_agent(self):
+        """Agente de MS-Agent v1.4.0"""
+        return LLMAgent()
+    
+    @LazyComponent
+    def config(self):
+        """Configuración por defecto de MS-Agent"""
+        return Config()
+    
+    @LazyComponent
+    def tool_manager(self):
+        """Gestor de herramientas de MS-Agent"""
+        return ToolManager(config=self.config)
+    
+    @LazyComponent
+    def rag_manager(self):
+        """RAG opcional (None si no está disponible)"""
+        try:
+            # Intentar crear RAG con configuración básica
+            return LlamaIndexRAG(config=self.config.config) if hasattr(self.config, 'config') else None
+        except Exception as e:
+            logger.warning(f"⚠️ RAG no disponible: {e}")
+            return None
+    
+    @LazyComponent
+    def rag_cache(self):
+        """
+        Caché de recuperación RAG por consulta normalizada
+        
+        Si el RAG expone su modelo de embeddings (embed_model de LlamaIndex) y
+        ORUS_RAG_CACHE_SIMILARITY > 0, las consultas casi idénticas también
+        reutilizan el resultado.
+        """
+        embed_model = getattr(self.rag_manager, 'embed_model', None)
+        embed = getattr(embed_model, 'get_query_embedding', None) or getattr(embed_model, 'get_text_embedding', None)
+        return RAGRetrievalCache(embed=embed)
+    
+    @LazyComponent
+    def anythingllm(self):
+        """Conector de AnythingLLM (None si no está disponible)"""
+        if not CONNECTORS_AVAILABLE:
+            return None
+        try:
+            connector = AnythingLLMConnector()
+            logger.info("✅ AnythingLLM Connector integrado")
+            return connector
+        except Exception as e:
+            logger.error(f"❌ Error inicializando AnythingLLM: {e}")
+            return None
+    
+    @LazyComponent
+    def teccia_sync(self):
+        """Sincronización con TECCIA-Z (None si no está disponible)"""
+        if not CONNECTORS_AVAILABLE:
+            return None
+        try:
+            sync = TECCIAZSync()
+            logger.info("✅ TECCIA-Z Sync integrado")
+            return sync
+        except Exception as e:
+            logger.error(f"❌ Error inicializando TECCIA-Z Sync: {e}")
+            return None
+    
+    @LazyComponent
+    def side_effects(self):
+        """
+        Cola write-behind de los envíos (None si no hay conectores o falla)
+        
+        Los envíos (HTTP bloqueante, timeout 30s) se guardan en una cola en
+        disco y los entrega un worker: la consulta no espera a la ingestión
+        """
+        if not (self.anythingllm or self.teccia_sync):
+            return None
+        try:
+            queue = WriteBehindQueue({
+                "anythingllm": self._deliver_to_anythingllm,
+                "teccia_sync": self._deliver_to_teccia,
+            }, db_path=DEFAULT_QUEUE_DB)
+            logger.info(f"✅ Cola write-behind activa: {queue.stats()}")
+            return queue
+        except Exception as e:
+            logger.error(f"❌ Cola write-behind no disponible, envíos en línea: {e}")
+            return None
+    
+    @LazyComponent
+    def mcp_client(self):
+        """Cliente MCP (nuevo en v1.4.0)"""
+        return MCPClient()
+    
     async def process_enhanced_query(self, query: str, use_async: bool = True) -> Dict[str, Any]:
         """
         Procesar consulta usando capacidades mejoradas de v1.4.0
@@ -124,11 +347,11 @@ class ORUSMSAgentv1_4:
                 result = await self._process_sync_compatible(query)
             
             # 5. Almacenar en AnythingLLM si está disponible
-            if self.anythingllm:
+            if await self._get_component("anythingllm"):
                 await self._store_in_anythingllm(query, result)
             
             # 6. Sincronizar con TECCIA-Z si está disponible
-            if self.teccia_sync:
+            if await self._get_component("teccia_sync"):
                 await self._sync_to_teccia(query, result)
             
             logger.info("✅ Consulta procesada exitosamente")
@@ -143,15 +366,62 @@ class ORUSMSAgentv1_4:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def _run_stage(self, stage: str, func, *args):
+        """
+        Ejecutar una etapa bloqueante en el executor con su timeout
+        
+        Si la etapa supera el timeout (o la consulta se cancela) se cancela su
+        future; una llamada que ya está en curso en un hilo no se puede
+        interrumpir, pero su resultado se descarta.
+        
+        Raises:
+            TimeoutError: Si la etapa supera stage_timeouts[stage]
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.stage_executor, func, *args)
+        timeout = self.stage_timeouts.get(stage)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ Etapa '{stage}' cancelada tras {timeout}s")
+            raise TimeoutError(f"Etapa '{stage}' superó el timeout de {timeout}s") from None
+    
+    async def _get_component(self, name: str) -> Any:
+        """Componente ya construido o, si no, construido en el executor (nunca en el event loop)"""
+        if name in self.__dict__:
+            return self.__dict__[name]
+        return await self._run_stage("init", getattr, self, name)
+    
+    async def _timed_stage(self, stage: str, coro, timings: Dict[str, float]):
+        """Esperar una etapa registrando su duración en `timings`"""
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[stage] = round(time.perf_counter() - started, 4)
+    
+    def close(self) -> None:
+        """Liberar el executor de etapas y detener el worker de la cola (lo pendiente queda en disco)"""
+        self._closed = True
+        with self._shared_lock:
+            if ORUSMSAgentv1_4._shared_instance is self:
+                ORUSMSAgentv1_4._shared_instance = None
+        self.stage_executor.shutdown(wait=False, cancel_futures=True)
+        side_effects = self.__dict__.get("side_effects")  # sin crear la cola si no se usó
+        if side_effects is not None:
+            side_effects.stop()
+    
     async def _process_async_enhanced(self, query: str) -> Dict[str, Any]:
         """Procesamiento asíncrono mejorado con v1.4.0"""
         logger.info("⚡ Usando procesamiento asíncrono v1.4.0...")
         
-        # Simular procesamiento multi-agente asíncrono
+        # Las tres etapas se ejecutan a la vez en el executor: la latencia
+        # total es la de la etapa más lenta (acotada por su timeout)
+        timings = {}
         tasks = [
-            self._ms_agent_process(query),
-            self._rag_enhance(query),
-            self._mcp_tools_discover(query)
+            self._timed_stage("ms_agent", self._ms_agent_process(query), timings),
+            self._timed_stage("rag", self._rag_enhance(query), timings),
+            self._timed_stage("mcp", self._mcp_tools_discover(query), timings)
         ]
         
         # Ejecutar en paralelo (capacidad v1.4.0)
@@ -168,6 +438,7 @@ class ORUSMSAgentv1_4:
             "ms_agent_response": ms_result,
             "rag_enhancement": rag_result,
             "mcp_tools": mcp_result,
+            "stage_timings": timings,
             "processing_mode": "async_enhanced_v1_4_0",
             "timestamp": datetime.now().isoformat()
         }
@@ -179,8 +450,8 @@ class ORUSMSAgentv1_4:
         # Procesar con MS-Agent
         ms_result = {}
         try:
-            # Usar el agente de manera síncrona
-            ms_result = self.ms_agent.run(query)
+            # Usar el agente de manera síncrona (fuera del event loop)
+            ms_result = await self._run_stage("ms_agent", self._ms_agent_run, query)
         except Exception as e:
             logger.warning(f"⚠️ Error con MS-Agent: {e}")
             ms_result = {"error": str(e)}
@@ -197,36 +468,92 @@ class ORUSMSAgentv1_4:
         """Procesar con MS-Agent v1.4.0"""
         try:
             # Usar capacidades mejoradas del agente
-            result = self.ms_agent.run(query)
+            result = await self._run_stage("ms_agent", self._ms_agent_run, query)
             return result if isinstance(result, dict) else {"response": str(result)}
         except Exception as e:
             return {"error": str(e)}
     
+    def _ms_agent_run(self, query: str) -> Any:
+        """Ejecutar MS-Agent (en el executor: la primera llamada construye el agente)"""
+        return self.ms_agent.run(query)
+    
+    def _rag_lookup(self, query: str) -> Any:
+        """Consulta RAG síncrona (se ejecuta en el executor de etapas)"""
+        if self.rag_manager is None:
+            return {"rag_available": False, "message": "RAG not initialized"}
+        # Las preguntas repetidas de los operadores no vuelven a consultar el índice
+        return self.rag_cache.lookup(query, self._rag_retrieve)
+    
+    def _rag_retrieve(self, query: str) -> Any:
+        """Consulta directa a rag_manager (sin caché)"""
+        # Nota: La clase RAG puede tener métodos diferentes
+        if hasattr(self.rag_manager, 'query'):
+            return self.rag_manager.query(query)
+        if hasattr(self.rag_manager, 'retrieve'):
+            return self.rag_manager.retrieve(query)
+        return {"rag_available": True, "message": "RAG initialized but methods not found"}
+    
     async def _rag_enhance(self, query: str) -> Dict[str, Any]:
         """Mejorar con RAG (nuevo en v1.4.0)"""
         try:
-            if self.rag_manager is None:
-                return {"rag_available": False, "message": "RAG not initialized"}
-            
             # Usar capacidades RAG mejoradas
-            # Nota: La clase RAG puede tener métodos diferentes
-            if hasattr(self.rag_manager, 'query'):
-                rag_result = self.rag_manager.query(query)
-            elif hasattr(self.rag_manager, 'retrieve'):
-                rag_result = self.rag_manager.retrieve(query)
-            else:
-                rag_result = {"rag_available": True, "message": "RAG initialized but methods not found"}
+            rag_result = await self._run_stage("rag", self._rag_lookup, query)
             
             return rag_result if isinstance(rag_result, dict) else {"rag_response": str(rag_result)}
         except Exception as e:
             return {"error": str(e)}
     
+    async def _get_mcp_tool_index(self) -> MCPToolIndex:
+        """
+        Índice de herramientas MCP, redescubiertas como mucho cada mcp_tools_refresh s
+        
+        El redescubrimiento se hace en el executor (_load_mcp_tool_index), así
+        que el lock es de hilos y no queda ligado a ningún event loop.
+        """
+        if self._mcp_tool_index is not None and time.monotonic() - self._mcp_tools_loaded_at < self.mcp_tools_refresh:
+            return self._mcp_tool_index
+        return await self._run_stage("mcp", self._load_mcp_tool_index)
+    
+    def _load_mcp_tool_index(self) -> MCPToolIndex:
+        """
+        Redescubrir las herramientas MCP (en el executor)
+        
+        Las consultas concurrentes comparten un único descubrimiento. Si el
+        refresco falla se sigue usando el índice anterior y se reintenta a
+        los MCP_TOOLS_RETRY s. La primera llamada construye el cliente MCP.
+        """
+        with self._mcp_tools_lock:
+            if self._mcp_tool_index is not None and time.monotonic() - self._mcp_tools_loaded_at < self.mcp_tools_refresh:
+                return self._mcp_tool_index
+            try:
+                tools = self.mcp_client.discover_tools()
+            except Exception as e:
+                if self._mcp_tool_index is None:
+                    raise
+                logger.warning(f"⚠️ Error refrescando herramientas MCP, se usa la caché: {e}")
+                self._mcp_tools_loaded_at = time.monotonic() - max(0.0, self.mcp_tools_refresh - MCP_TOOLS_RETRY)
+                return self._mcp_tool_index
+            self._mcp_tool_index = MCPToolIndex(list(tools))
+            self._mcp_tools_loaded_at = time.monotonic()
+            return self._mcp_tool_index
+    
+    def invalidate_rag_cache(self) -> int:
+        """Vaciar la caché de recuperación RAG (p. ej. tras reindexar documentos)"""
+        if "rag_cache" not in self.__dict__:
+            return 0
+        return self.rag_cache.invalidate()
+    
+    def invalidate_mcp_tools(self) -> None:
+        """Forzar el redescubrimiento de herramientas MCP en la próxima consulta"""
+        self._mcp_tools_loaded_at = 0.0
+    
     async def _mcp_tools_discover(self, query: str) -> Dict[str, Any]:
         """Descubrir herramientas MCP (nuevo en v1.4.0)"""
         try:
-            # Usar MCP Client para descubrir herramientas
-            tools = self.mcp_client.discover_tools()
-            relevant_tools = [tool for tool in tools if any(keyword in query.lower() for keyword in tool.get('keywords', []))]
+            # Herramientas descubiertas en caché + índice invertido por palabra clave
+            tool_index = await self._get_mcp_tool_index()
+            tools = tool_index.tools
+            relevant_tools = tool_index.match(query)
             
             return {
                 "available_tools": len(tools),
@@ -237,8 +564,8 @@ class ORUSMSAgentv1_4:
             return {"error": str(e)}
     
     async def _store_in_anythingllm(self, query: str, result: Dict[str, Any]) -> bool:
-        """Almacenar resultado en AnythingLLM"""
-        if not self.anythingllm:
+        """Encolar el resultado para AnythingLLM (True si quedó encolado o se almacenó)"""
+        if not await self._get_component("anythingllm"):
             return False
         
         try:
@@ -255,24 +582,35 @@ Respuesta del Sistema:
 ---
 Procesado por: ORUS-MS-Agent v1.4.0 Integration
             """
+            payload = {"content": content}
             
-            llm_result = self.anythingllm.send_to_anythingllm(
-                content=content,
-                source="ORUS-MS-Agent-v1.4.0",
-                content_type="enhanced_query",
-                tags=["v1.4.0", "enhanced", "async", "mcp"]
-            )
+            side_effects = await self._get_component("side_effects")
+            if side_effects is not None:
+                job_id = side_effects.enqueue("anythingllm", payload)
+                logger.info(f"🗃️ Envío a AnythingLLM encolado (#{job_id})")
+                return True
             
-            logger.info(f"✅ Almacenado en AnythingLLM: {llm_result.get('success', False)}")
-            return llm_result.get('success', False)
+            return await self._run_stage("side_effects", self._deliver_to_anythingllm, payload)
             
         except Exception as e:
             logger.error(f"❌ Error almacenando en AnythingLLM: {e}")
             return False
     
+    def _deliver_to_anythingllm(self, payload: Dict[str, Any]) -> bool:
+        """Enviar a AnythingLLM (llamada bloqueante, la ejecuta el worker de la cola)"""
+        llm_result = self.anythingllm.send_to_anythingllm(
+            content=payload["content"],
+            source="ORUS-MS-Agent-v1.4.0",
+            content_type="enhanced_query",
+            tags=["v1.4.0", "enhanced", "async", "mcp"]
+        )
+        
+        logger.info(f"✅ Almacenado en AnythingLLM: {llm_result.get('success', False)}")
+        return llm_result.get('success', False)
+    
     async def _sync_to_teccia(self, query: str, result: Dict[str, Any]) -> bool:
-        """Sincronizar resultado con TECCIA-Z"""
-        if not self.teccia_sync:
+        """Encolar la sincronización con TECCIA-Z (True si quedó encolada o se sincronizó)"""
+        if not await self._get_component("teccia_sync"):
             return False
         
         try:
@@ -294,33 +632,55 @@ Resultados:
 Detalles completos en el sistema de logs.
             """.strip()
             
-            sync_result = self.teccia_sync.send_custom_trabajo(
-                titulo=title,
-                descripcion=description,
-                categoria="Integración Cognitiva v1.4.0"
-            )
+            payload = {
+                "titulo": title,
+                "descripcion": description,
+                "categoria": "Integración Cognitiva v1.4.0"
+            }
+            
+            side_effects = await self._get_component("side_effects")
+            if side_effects is not None:
+                job_id = side_effects.enqueue("teccia_sync", payload)
+                logger.info(f"🗃️ Sincronización con TECCIA-Z encolada (#{job_id})")
+                return True
             
-            logger.info(f"✅ Sincronizado con TECCIA-Z: {sync_result.get('success', False)}")
-            return sync_result.get('success', False)
+            return await self._run_stage("side_effects", self._deliver_to_teccia, payload)
             
         except Exception as e:
             logger.error(f"❌ Error sincronizando con TECCIA-Z: {e}")
             return False
     
+    def _deliver_to_teccia(self, payload: Dict[str, Any]) -> bool:
+        """Enviar a TECCIA-Z (llamada bloqueante, la ejecuta el worker de la cola)"""
+        sync_result = self.teccia_sync.send_custom_trabajo(**payload)
+        
+        logger.info(f"✅ Sincronizado con TECCIA-Z: {sync_result.get('success', False)}")
+        return sync_result.get('success', False)
+    
     def get_system_status(self) -> Dict[str, Any]:
-        """Obtener estado completo del sistema"""
+        """
+        Obtener estado completo del sistema
+        
+        No construye componentes: los que aún no se han usado (ni precalentado
+        con warm_up) aparecen como "not_initialized".
+        """
         status = self.system_status.copy()
+        built = self.__dict__
+        status["components_ready"] = [name for name in self.COMPONENTS if name in built]
         
         # Añadir estado de conectores
-        if self.anythingllm:
-            status["anythingllm_status"] = "connected"
-        else:
-            status["anythingllm_status"] = "disconnected"
+        for name in ("anythingllm", "teccia_sync"):
+            status[f"{name}_connected"] = built.get(name) is not None
+            if name not in built:
+                status[f"{name}_status"] = "not_initialized"
+            else:
+                status[f"{name}_status"] = "connected" if built[name] else "disconnected"
         
-        if self.teccia_sync:
-            status["teccia_sync_status"] = "connected"
-        else:
-            status["teccia_sync_status"] = "disconnected"
+        if built.get("side_effects") is not None:
+            status["write_behind_queue"] = built["side_effects"].stats()
+        
+        if "rag_cache" in built:
+            status["rag_cache"] = built["rag_cache"].stats()
         
         # Añadir capacidades v1.4.0
         status["v1_4_0_features"] = {
@@ -368,6 +728,7 @@ def main():
     async def run_tests():
         # Inicializar wrapper
         wrapper = ORUSMSAgentv1_4()
+        await asyncio.to_thread(wrapper.warm_up)
         
         # Mostrar estado del sistema
         status = wrapper.get_system_status()
@@ -387,6 +748,8 @@ def main():
         )
         print("Resultado de consulta:")
         print(json.dumps(query_result, indent=2, ensure_ascii=False))
+        
+        wrapper.close()
     
     # Ejecutar pruebas
     asyncio.run(run_tests())
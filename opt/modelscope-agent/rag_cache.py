@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+🧠 Caché de recuperación RAG para ORUS-MS-Agent
+Reutiliza los resultados de rag_manager para consultas repetidas o casi
+idénticas: clave por texto normalizado y, opcionalmente, aciertos por
+similitud de embeddings
+"""
+
+import math
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+RAG_CACHE_SIZE = int(os.environ.get("ORUS_RAG_CACHE_SIZE", "256"))
+RAG_CACHE_TTL = float(os.environ.get("ORUS_RAG_CACHE_TTL", "600"))
+# Similitud coseno mínima para reutilizar el resultado de otra consulta. Por
+# defecto desactivada (0): cada fallo exacto costaría una llamada de embedding
+RAG_CACHE_SIMILARITY = float(os.environ.get("ORUS_RAG_CACHE_SIMILARITY", "0"))
+
+WORD_PATTERN = re.compile(r"\w+")
+
+def normalize_query(text: str) -> str:
+    """
+    Texto normalizado de una consulta
+
+    Ignora mayúsculas, puntuación y espacios, de modo que
+    "ORUS, ¿estado del sistema?" y "orus estado del  sistema" comparten entrada.
+    """
+    return " ".join(WORD_PATTERN.findall((text or "").casefold()))
+
+def _unit_vector(vector: Sequence[float]):
+    """Vector normalizado (la similitud coseno queda en un producto escalar)"""
+    if NUMPY_AVAILABLE:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else None
+    vector = [float(x) for x in vector]
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else None
+
+def _dot(a, b) -> float:
+    if NUMPY_AVAILABLE:
+        return float(np.dot(a, b))
+    return sum(x * y for x, y in zip(a, b))
+
+class _Flight:
+    """Recuperación en curso de una clave, compartida por las consultas que llegan a la vez"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class RAGRetrievalCache:
+    """
+    Caché LRU con TTL de resultados de recuperación RAG
+
+    La búsqueda exacta (texto normalizado) no cuesta nada. Si se pasa
+    `embed`, en un fallo exacto se calcula el embedding de la consulta y se
+    reutiliza la entrada más parecida cuya similitud coseno alcance
+    `similarity_threshold`. Las consultas idénticas que fallan a la vez
+    comparten una sola recuperación (single-flight). Segura entre hilos; lleva
+    contadores de aciertos exactos, por similitud y compartidos, y de fallos
+    para medir la tasa de acierto.
+    """
+
+    def __init__(self, max_size: int = RAG_CACHE_SIZE, ttl: float = RAG_CACHE_TTL,
+                 embed: Optional[Callable[[str], Sequence[float]]] = None,
+                 similarity_threshold: float = RAG_CACHE_SIMILARITY):
+        """
+        Args:
+            max_size: Número máximo de entradas (0 desactiva la caché)
+            ttl: Segundos de vida de cada entrada
+            embed: Función texto -> embedding (None desactiva los aciertos por similitud)
+            similarity_threshold: Similitud coseno mínima para un acierto por similitud
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.embed = embed if similarity_threshold > 0 else None
+        self.similarity_threshold = similarity_threshold
+        self._data = OrderedDict()  # texto normalizado -> (resultado, embedding, caduca_en)
+        self._lock = threading.Lock()
+        self._inflight = {}  # texto normalizado -> _Flight
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.coalesced_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.embed_errors = 0
+
+    def _embedding(self, key: str):
+        try:
+            return _unit_vector(self.embed(key))
+        except Exception:
+            with self._lock:
+                self.embed_errors += 1
+            return None
+
+    def _purge_expired(self, now: float) -> None:
+        for key in [key for key, (_, _, expires_at) in self._data.items() if now >= expires_at]:
+            del self._data[key]
+            self.expired += 1
+
+    def lookup(self, query: str, retrieve: Callable[[str], Any]) -> Any:
+        """
+        Resultado en caché para `query` o, si no hay, el de `retrieve(query)`
+
+        Solo se guardan los resultados de llamadas que no lanzan excepción;
+        las consultas que esperaban a una recuperación fallida reciben la
+        misma excepción.
+        """
+        if self.max_size <= 0:
+            return retrieve(query)
+
+        key = normalize_query(query)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and now >= entry[2]:
+                del self._data[key]
+                self.expired += 1
+                entry = None
+            if entry is not None:
+                self._data.move_to_end(key)
+                self.exact_hits += 1
+                return entry[0]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self.coalesced_hits += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._lookup_miss(key, query, retrieve, now)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            flight.done.set()
+
+    def _lookup_miss(self, key: str, query: str, retrieve: Callable[[str], Any], now: float) -> Any:
+        """Acierto por similitud o, si no hay, recuperar y guardar (solo el líder de la clave)"""
+        embedding = self._embedding(key) if self.embed is not None else None
+        if embedding is not None:
+            with self._lock:
+                self._purge_expired(now)
+                best_key, best_similarity = None, self.similarity_threshold
+                for other_key, (_, other_embedding, _) in self._data.items():
+                    if other_embedding is None:
+                        continue
+                    similarity = _dot(embedding, other_embedding)
+                    if similarity >= best_similarity:
+                        best_key, best_similarity = other_key, similarity
+                if best_key is not None:
+                    self._data.move_to_end(best_key)
+                    self.similar_hits += 1
+                    return self._data[best_key][0]
+
+        with self._lock:
+            self.misses += 1
+        result = retrieve(query)
+
+        with self._lock:
+            self._data[key] = (result, embedding, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def invalidate(self) -> int:
+        """Vaciar la caché (p. ej. tras reindexar documentos); devuelve las entradas eliminadas"""
+        with self._lock:
+            removed = len(self._data)
+            self._data.clear()
+            return removed
+
+    def stats(self) -> dict:
+        """Contadores de uso de la caché"""
+        with self._lock:
+            hits = self.exact_hits + self.similar_hits + self.coalesced_hits
+            lookups = hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "similarity_enabled": self.embed is not None,
+                "similarity_threshold": self.similarity_threshold,
+                "exact_hits": self.exact_hits,
+                "similar_hits": self.similar_hits,
+                "coalesced_hits": self.coalesced_hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "embed_errors": self.embed_errors,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
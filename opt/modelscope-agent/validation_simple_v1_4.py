@@ -26,6 +26,7 @@ def main():
         # 1. Inicialización
         print("📋 Inicializando ORUS-MS-Agent v1.4.0...")
         wrapper = ORUSMSAgentv1_4()
+        wrapper.warm_up()  # construir conectores y componentes antes de leer el estado
         print("✅ Sistema inicializado correctamente")
         
         # 2. Estado del sistema
@@ -26,6 +26,7 @@ async def main():
     print("📋 Paso 1/5: Inicializando sistema...")
     try:
         wrapper = ORUSMSAgentv1_4()
+        await asyncio.to_thread(wrapper.warm_up)  # construir componentes fuera del event loop
         print("✅ Sistema inicializado correctamente")
     except Exception as e:
         print(f"❌ Error en inicialización: {e}")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+🗃️ Cola write-behind persistente para ORUS-MS-Agent
+Guarda en SQLite los efectos secundarios (AnythingLLM, TECCIA-Z) y los entrega
+desde un worker en segundo plano, con reintentos y sin perder nada al reiniciar
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_DB = os.environ.get(
+    "ORUS_WRITE_BEHIND_DB", "/home/z/teccia-z/opt/modelscope-agent/data/write_behind.db"
+)
+# Cada cuánto drain() comprueba que el worker sigue vivo mientras espera
+DRAIN_POLL_INTERVAL = 0.1
+
+class WriteBehindQueue:
+    """
+    Cola de trabajos en SQLite con un worker que los entrega en segundo plano
+
+    Cada trabajo tiene un tipo (`kind`) y un payload JSON; el worker llama al
+    handler registrado para ese tipo, que devuelve True si la entrega tuvo
+    éxito. Los fallos se reintentan con backoff exponencial y, agotados los
+    intentos, el trabajo queda como 'dead' en la base de datos para revisarlo.
+
+    Varias colas (hilos o procesos) pueden compartir la misma base de datos:
+    cada trabajo se reclama con un UPDATE atómico ('pending' -> 'inflight',
+    con un plazo `lease_timeout`) antes de llamar al handler, así que solo lo
+    entrega un worker. La entrega es al menos una vez: si el proceso muere
+    con un trabajo reclamado, vuelve a 'pending' al vencer su plazo.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[[Dict[str, Any]], bool]],
+                 db_path: str = DEFAULT_QUEUE_DB, poll_interval: float = 5.0,
+                 max_attempts: int = 8, base_delay: float = 2.0, max_delay: float = 300.0,
+                 batch_size: int = 32, lease_timeout: float = 300.0, start: bool = True):
+        """
+        Args:
+            handlers: Función de entrega por tipo de trabajo
+            db_path: Archivo SQLite de la cola
+            poll_interval: Segundos máximos entre revisiones de la cola
+            max_attempts: Intentos antes de marcar un trabajo como 'dead'
+            base_delay: Espera tras el primer fallo (se duplica en cada intento)
+            max_delay: Espera máxima entre intentos
+            batch_size: Trabajos leídos por consulta
+            lease_timeout: Segundos que un trabajo reclamado queda reservado a este worker
+            start: Arrancar el worker inmediatamente
+        """
+        self.handlers = handlers
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.batch_size = batch_size
+        self.lease_timeout = lease_timeout
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        # WAL: las escrituras de enqueue no esperan a las lecturas del worker
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                last_error TEXT,
+                lease_until REAL
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "lease_until" not in columns:  # base de datos creada por una versión anterior
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN lease_until REAL")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_due ON jobs (status, next_attempt_at)")
+
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._idle = threading.Event()
+        self._worker = None
+        if start:
+            self.start()
+
+    def start(self) -> None:
+        """Arrancar el worker (entrega también lo pendiente de ejecuciones anteriores)"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._requeue_expired()
+        self._worker = threading.Thread(target=self._run, name="orus-write-behind", daemon=True)
+        self._worker.start()
+
+    def enqueue(self, kind: str, payload: Dict[str, Any]) -> int:
+        """
+        Guardar un trabajo en la cola (rápido: una inserción en SQLite)
+
+        Returns:
+            Identificador del trabajo
+
+        Raises:
+            ValueError: Si no hay handler para `kind`
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Tipo de trabajo sin handler: {kind}")
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (kind, payload, next_attempt_at, created_at) VALUES (?, ?, ?, ?)",
+                (kind, json.dumps(payload, ensure_ascii=False), now, now)
+            )
+        self._idle.clear()
+        self._wakeup.set()
+        return cursor.lastrowid
+
+    def _requeue_expired(self) -> int:
+        """Devolver a 'pending' los trabajos reclamados cuyo plazo venció (worker caído)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'pending', lease_until = NULL "
+                "WHERE status = 'inflight' AND lease_until <= ?",
+                (time.time(),)
+            )
+        if cursor.rowcount:
+            logger.warning(f"⚠️ {cursor.rowcount} trabajos con el plazo vencido vuelven a la cola")
+        return cursor.rowcount
+
+    def _claim(self, job_id: int) -> bool:
+        """Reservar un trabajo para este worker (False si otro lo reclamó antes)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'inflight', lease_until = ? WHERE id = ? AND status = 'pending'",
+                (time.time() + self.lease_timeout, job_id)
+            )
+        return cursor.rowcount == 1
+
+    def _due_jobs(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, kind, payload, attempts FROM jobs "
+                "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (time.time(), self.batch_size)
+            ).fetchall()
+
+    def _next_due_in(self) -> float:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM jobs WHERE status = 'pending'"
+            ).fetchone()
+        if row[0] is None:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, row[0] - time.time()))
+
+    def _deliver(self, job_id: int, kind: str, payload: str, attempts: int) -> None:
+        if not self._claim(job_id):
+            return
+        error = None
+        try:
+            delivered = bool(self.handlers[kind](json.loads(payload)))
+            if not delivered:
+                error = "handler devolvió False"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+
+        with self._lock:
+            if error is None:
+                self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+                return
+            attempts += 1
+            if attempts >= self.max_attempts:
+                logger.error(f"❌ Trabajo {kind}#{job_id} descartado tras {attempts} intentos: {error}")
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'dead', attempts = ?, last_error = ?, lease_until = NULL "
+                    "WHERE id = ?",
+                    (attempts, error, job_id)
+                )
+            else:
+                delay = min(self.max_delay, self.base_delay * (2 ** (attempts - 1)))
+                logger.warning(f"⚠️ Trabajo {kind}#{job_id} falló ({error}), reintento en {delay:.0f}s")
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'pending', attempts = ?, next_attempt_at = ?, last_error = ?, "
+                    "lease_until = NULL WHERE id = ?",
+                    (attempts, time.time() + delay, error, job_id)
+                )
+
+    def _run(self) -> None:
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                self._requeue_expired()
+                jobs = self._due_jobs()
+                if jobs:
+                    self._idle.clear()
+                for job in jobs:
+                    if self._stop.is_set():
+                        return
+                    self._deliver(*job)
+                failures = 0
+                if jobs:
+                    continue
+
+                self._idle.set()
+                self._wakeup.wait(self._next_due_in())
+                self._wakeup.clear()
+            except Exception as e:
+                # Base de datos bloqueada por otro proceso, disco lleno...: el
+                # worker sigue vivo y lo reclamado se recupera al vencer su plazo
+                if self._stop.is_set():
+                    return
+                failures += 1
+                delay = min(self.max_delay, self.base_delay * (2 ** (failures - 1)))
+                logger.error(f"❌ Error en el worker de la cola ({e}), reintento en {delay:.0f}s")
+                self._stop.wait(delay)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Esperar a que no queden trabajos listos para entregar
+
+        Sin worker activo (start=False o tras stop()) devuelve False sin
+        esperar: nadie entregaría lo pendiente.
+
+        Returns:
+            True si la cola quedó vacía de trabajos vencidos antes del timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._wakeup.set()
+        while True:
+            if self._worker is None or not self._worker.is_alive():
+                return False
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            # Espera por tramos para advertir si el worker se detiene entretanto
+            if not self._idle.wait(DRAIN_POLL_INTERVAL if remaining is None else min(remaining, DRAIN_POLL_INTERVAL)):
+                if deadline is not None and time.monotonic() >= deadline:
+                    return False
+                continue
+            if not self._due_jobs():
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)  # el worker aún no ha recogido lo recién encolado
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """Detener el worker tras el trabajo en curso (lo pendiente queda en disco)"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            if self._worker.is_alive():
+                # Un handler sigue en curso: cerrar la conexión rompería su
+                # actualización; el trabajo se recupera al vencer su plazo
+                logger.warning("⚠️ El worker de la cola no terminó a tiempo; la conexión queda abierta")
+                return
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Trabajos por estado"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {"pending": 0, "inflight": 0, "dead": 0}
+        counts.update(dict(rows))
+        return counts
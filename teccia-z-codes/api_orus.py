@@ -6,11 +6,61 @@ Endpoints principales para consulta y gestión del sistema
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Match
 import uvicorn
+import argparse
+import asyncio
 from datetime import datetime
+import contextlib
+import contextvars
+import copy
+import importlib.util
 import json
+import multiprocessing
+import signal
+import socket
 import sys
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Codificadores compactos (opcionales: pip install orjson msgpack) para la
+# negociación de contenido; sin ellos se sirve JSON con json.dumps
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Pool acotado para trabajo bloqueante (disco) fuera del event loop
+BLOCKING_WORKERS = int(os.environ.get("ORUS_BLOCKING_WORKERS", "4"))
+blocking_executor = ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix="orus-blocking")
+
+# Límite de peticiones concurrentes por ruta
+ROUTE_CONCURRENCY = {
+    "query": int(os.environ.get("ORUS_QUERY_CONCURRENCY", "64")),
+    "logs": int(os.environ.get("ORUS_LOGS_CONCURRENCY", "2"))
+}
+route_limits = {route: asyncio.Semaphore(limit) for route, limit in ROUTE_CONCURRENCY.items()}
+
+async def run_blocking(func, *args):
+    """Ejecutar una función bloqueante en el pool acotado"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(blocking_executor, func, *args)
 
 # Agregar path del módulo log-analyzer
 sys.path.append('/opt/modelscope-agent/mcp/log-analyzer')
@@ -20,10 +70,610 @@ try:
 except ImportError:
     LOG_ANALYZER_AVAILABLE = False
 
+# Caché LRU+TTL de respuestas de /query
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+try:
+    from orus_client.cache import TTLLRUCache, make_query_key
+    QUERY_CACHE_AVAILABLE = True
+except ImportError:
+    QUERY_CACHE_AVAILABLE = False
+
+QUERY_CACHE_SIZE = int(os.environ.get("ORUS_QUERY_CACHE_SIZE", "1024"))
+QUERY_CACHE_TTL = float(os.environ.get("ORUS_QUERY_CACHE_TTL", "60"))
+query_cache = TTLLRUCache(QUERY_CACHE_SIZE, QUERY_CACHE_TTL) if QUERY_CACHE_AVAILABLE else None
+
+# Segundos que un análisis de logs en caché sigue siendo válido
+LOGS_CACHE_TTL = float(os.environ.get("ORUS_LOGS_CACHE_TTL", "30"))
+
+# Archivo opcional para compartir la caché de /logs entre procesos worker
+LOGS_CACHE_FILE = os.environ.get("ORUS_LOGS_CACHE_FILE")
+
+class LogAnalysisCache:
+    """
+    Caché de resultados de LogAnalyzer para el endpoint /logs
+    
+    Un resultado se reutiliza mientras la huella (ruta, mtime, tamaño) de los
+    archivos analizados no cambie y no haya superado el TTL. Las peticiones
+    concurrentes que no encuentran resultado válido comparten un único
+    análisis (single-flight) en lugar de lanzar uno cada una.
+    
+    Con `shared_file` el resultado se guarda también en disco y un lock de
+    archivo coordina a los procesos worker, de modo que solo uno analiza y
+    el resto reutiliza su resultado.
+    """
+    
+    def __init__(self, analyzer, ttl: float = LOGS_CACHE_TTL, shared_file: str = LOGS_CACHE_FILE):
+        self.analyzer = analyzer
+        self.ttl = ttl
+        self.shared_file = shared_file
+        self._lock = threading.Lock()
+        self._entry = None      # {"fingerprint", "result", "created_at"}
+        self._inflight = None   # análisis en curso compartido
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.shared_hits = 0
+    
+    def fingerprint(self) -> list:
+        """Huella (ruta, mtime, tamaño) de los archivos que se analizarían"""
+        log_files, skipped = self.analyzer.collect_log_files(verbose=False)
+        entries = []
+        for log_file in sorted(log_files):
+            try:
+                stat = os.stat(log_file)
+                entries.append([log_file, stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                entries.append([log_file, None, None])
+        return [entries, skipped]
+    
+    def _is_fresh(self, entry: dict, fingerprint: list) -> bool:
+        """Comprobar si una entrada corresponde a la huella y sigue vigente"""
+        return (
+            entry is not None
+            and entry.get("fingerprint") == fingerprint
+            and time.time() - entry.get("created_at", 0) < self.ttl
+        )
+    
+    def _shared_lock(self):
+        """Lock de archivo entre procesos (no-op sin archivo compartido o sin fcntl)"""
+        if not self.shared_file or fcntl is None:
+            return contextlib.nullcontext()
+        
+        @contextlib.contextmanager
+        def file_lock():
+            with open(f"{self.shared_file}.lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        
+        return file_lock()
+    
+    def _load_shared(self):
+        """Leer la entrada compartida en disco, si existe"""
+        if not self.shared_file or not os.path.exists(self.shared_file):
+            return None
+        
+        try:
+            with open(self.shared_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return None
+    
+    def _store_shared(self, entry: dict) -> None:
+        """Guardar la entrada compartida en disco de forma atómica"""
+        if not self.shared_file:
+            return
+        
+        try:
+            tmp_file = f"{self.shared_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_file, self.shared_file)
+        except Exception as e:
+            print(f"⚠️  No se pudo guardar la caché compartida {self.shared_file}: {e}")
+    
+    def _analyze(self, fingerprint: list) -> dict:
+        """Ejecutar el análisis, reutilizando el de otro proceso si es vigente"""
+        with self._shared_lock():
+            entry = self._load_shared()
+            if self._is_fresh(entry, fingerprint):
+                self.shared_hits += 1
+                return entry
+            
+            entry = {
+                "fingerprint": fingerprint,
+                "result": self.analyzer.analyze_all_logs(),
+                "created_at": time.time()
+            }
+            self._store_shared(entry)
+            return entry
+    
+    def get(self) -> dict:
+        """Devolver el análisis en caché o ejecutar uno nuevo"""
+        fingerprint = self.fingerprint()
+        
+        with self._lock:
+            if self._is_fresh(self._entry, fingerprint):
+                self.hits += 1
+                return self._entry["result"]
+            
+            flight = self._inflight
+            leader = flight is None
+            if leader:
+                flight = self._inflight = {"event": threading.Event(), "result": None, "error": None}
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        
+        if not leader:
+            flight["event"].wait()
+            if flight["error"] is not None:
+                raise flight["error"]
+            return flight["result"]
+        
+        try:
+            entry = self._analyze(fingerprint)
+            flight["result"] = entry["result"]
+            with self._lock:
+                self._entry = entry
+            return entry["result"]
+        except Exception as e:
+            flight["error"] = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight = None
+            flight["event"].set()
+    
+    def invalidate(self) -> None:
+        """Descartar el resultado en caché (también el compartido)"""
+        with self._lock:
+            self._entry = None
+        if self.shared_file and os.path.exists(self.shared_file):
+            try:
+                os.remove(self.shared_file)
+            except OSError:
+                pass
+    
+    def stats(self) -> dict:
+        """Contadores de uso de la caché"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "shared_hits": self.shared_hits,
+            "ttl": self.ttl,
+            "shared_file": self.shared_file
+        }
+
+log_analyzer = LogAnalyzer() if LOG_ANALYZER_AVAILABLE else None
+log_analysis_cache = LogAnalysisCache(log_analyzer) if LOG_ANALYZER_AVAILABLE else None
+
+# Segundos entre comprobaciones del modo follow y entre keepalives SSE
+LOGS_FOLLOW_INTERVAL = float(os.environ.get("ORUS_LOGS_FOLLOW_INTERVAL", "1"))
+LOGS_FOLLOW_KEEPALIVE = 15
+
+class LogErrorBroadcaster:
+    """
+    Difunde a los suscriptores los errores detectados en vivo por LogAnalyzer.follow
+    
+    Un único hilo sigue los logs mientras haya suscriptores; cada suscriptor
+    recibe los errores en su propia asyncio.Queue acotada (si se llena se
+    descartan los errores más antiguos). Si llega un suscriptor mientras el
+    hilo anterior aún termina, el nuevo espera a que acabe antes de seguir
+    los logs, y el anterior ya no publica nada: ningún error se difunde dos
+    veces.
+    """
+    
+    def __init__(self, analyzer, queue_size: int = 1000):
+        self.analyzer = analyzer
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop_event = None
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Registrar un suscriptor en el event loop actual"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+            if self._thread is None or self._stop_event.is_set() or not self._thread.is_alive():
+                self._stop_event = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._stop_event, self._thread), name="orus-log-follow", daemon=True
+                )
+                self._thread.start()
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Eliminar un suscriptor; el seguimiento se detiene con el último"""
+        with self._lock:
+            self._subscribers.pop(queue, None)
+            if not self._subscribers and self._stop_event is not None:
+                self._stop_event.set()
+    
+    def _run(self, stop_event: threading.Event, previous: threading.Thread = None) -> None:
+        """Hilo de seguimiento de logs (espera antes a que termine el hilo anterior)"""
+        try:
+            if previous is not None:
+                previous.join()
+            for error in self.analyzer.follow(poll_interval=LOGS_FOLLOW_INTERVAL, stop_event=stop_event):
+                with self._lock:
+                    if stop_event.is_set():
+                        break  # detenido: lo que queda lo publica el hilo siguiente
+                    subscribers = list(self._subscribers.items())
+                for queue, loop in subscribers:
+                    loop.call_soon_threadsafe(self._offer, queue, error)
+        except Exception as e:
+            print(f"❌ Error en seguimiento de logs: {e}")
+    
+    @staticmethod
+    def _offer(queue: asyncio.Queue, error: dict) -> None:
+        """Encolar un error descartando el más antiguo si la cola está llena"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(error)
+
+log_broadcaster = LogErrorBroadcaster(LogAnalyzer()) if LOG_ANALYZER_AVAILABLE else None
+
+# Formatos de salida soportados por /logs/stream
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream"
+}
+
+# Errores que se extraen del analizador por cada salto al pool bloqueante; un
+# lote se envía antes si pasan STREAM_FLUSH_INTERVAL s (errores dispersos)
+STREAM_BATCH_SIZE = 64
+STREAM_FLUSH_INTERVAL = 0.05
+
+async def stream_log_errors(stream_format: str):
+    """
+    Generar el análisis de logs como NDJSON o Server-Sent Events
+    
+    Cada error se emite en cuanto el analizador lo encuentra y al final se
+    envía un registro resumen con el total. La lectura de disco avanza por
+    lotes en el pool bloqueante para no detener el event loop: el primer
+    lote es de un solo error y los siguientes se envían al llenarse o a los
+    STREAM_FLUSH_INTERVAL s. La plaza de route_limits["logs"] solo se ocupa
+    mientras se lee cada lote, así que un lector lento no bloquea /logs.
+    """
+    def encode(event: str, payload: dict) -> str:
+        data = json.dumps(payload, ensure_ascii=False)
+        if stream_format == "sse":
+            return f"event: {event}\ndata: {data}\n\n"
+        return data + "\n"
+    
+    def next_batch(errors, limit: int) -> list:
+        batch = []
+        deadline = time.monotonic() + STREAM_FLUSH_INTERVAL
+        for error in errors:
+            batch.append(error)
+            if len(batch) >= limit or time.monotonic() >= deadline:
+                break
+        return batch
+    
+    total_errors = 0
+    try:
+        errors = log_analyzer.iter_errors()
+        limit = 1  # primer error cuanto antes
+        while True:
+            async with route_limits["logs"]:
+                batch = await run_blocking(next_batch, errors, limit)
+            if not batch:
+                break
+            limit = STREAM_BATCH_SIZE
+            for error in batch:
+                total_errors += 1
+                yield encode("log_error", error)
+        
+        yield encode("summary", {
+            "status": "ok",
+            "total_errors": total_errors,
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        })
+    except Exception as e:
+        yield encode("summary", {
+            "status": "error",
+            "error": str(e),
+            "total_errors": total_errors,
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        })
+
+# Tamaño máximo de /query/batch y umbral a partir del cual se responde en streaming
+QUERY_BATCH_MAX = int(os.environ.get("ORUS_QUERY_BATCH_MAX", "1000"))
+QUERY_BATCH_STREAM_THRESHOLD = int(os.environ.get("ORUS_QUERY_BATCH_STREAM_THRESHOLD", "100"))
+
+async def process_query(data: dict) -> dict:
+    """Procesar una consulta a ORUS (con caché por texto y origen normalizados)"""
+    async with route_limits["query"]:
+        try:
+            text = data.get("text", "")
+            source = data.get("source", "unknown")
+            
+            cache_key = make_query_key(text, source) if query_cache is not None else None
+            if cache_key is not None:
+                cached = query_cache.get(cache_key)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+            
+            # Simulación de procesamiento (aquí iría la lógica real de ORUS)
+            response_text = f"ORUS ha procesado: '{text}' desde {source}"
+            
+            result = {
+                "status": "ok",
+                "message": response_text,
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "source": source
+            }
+            if cache_key is not None:
+                # Copia: modificar la respuesta no altera la entrada en caché
+                query_cache.set(cache_key, copy.deepcopy(result))
+            return result
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            }
+
+async def stream_query_batch(queries: list):
+    """
+    Procesar un lote de consultas emitiendo cada resultado como NDJSON
+    
+    Los resultados se envían en orden de finalización con su `index` en el
+    lote; al final se envía un registro resumen.
+    """
+    async def indexed(index: int, query: dict):
+        return index, await process_query(query)
+    
+    tasks = [asyncio.ensure_future(indexed(i, query)) for i, query in enumerate(queries)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, result = await next_done
+            yield json.dumps({"index": index, **result}, ensure_ascii=False) + "\n"
+        
+        yield json.dumps({
+            "status": "ok",
+            "total": len(queries),
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }) + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+# Negociación de contenido: formato de respuesta según la cabecera Accept
+RESPONSE_MEDIA_TYPES = {
+    "json": "application/json",
+    "msgpack": "application/msgpack",
+}
+ACCEPT_FORMATS = {
+    "application/json": "json",
+    "application/msgpack": "msgpack",
+    "application/x-msgpack": "msgpack",
+}
+response_format = contextvars.ContextVar("response_format", default="json")
+
+def negotiate_format(accept: str) -> str:
+    """
+    Elegir el formato de respuesta a partir de la cabecera Accept
+
+    Se respeta la calidad (q) de cada tipo; msgpack solo se ofrece si está
+    instalado y, sin preferencia explícita, se responde JSON.
+    """
+    best_format, best_quality = "json", 0.0
+    for item in accept.split(","):
+        media_type, _, params = item.strip().partition(";")
+        fmt = ACCEPT_FORMATS.get(media_type.strip().lower())
+        if fmt is None or (fmt == "msgpack" and not MSGPACK_AVAILABLE):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > best_quality:
+            best_format, best_quality = fmt, quality
+    return best_format
+
+class ContentNegotiationMiddleware:
+    """Middleware ASGI que fija el formato de respuesta de cada petición"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = next((value for name, value in scope["headers"] if name == b"accept"), b"")
+        token = response_format.set(negotiate_format(accept.decode("latin-1")) if accept else "json")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_format.reset(token)
+
+class NegotiatedResponse(JSONResponse):
+    """
+    Respuesta por defecto de la API: msgpack o JSON compacto
+
+    JSON se serializa con orjson si está instalado (sin espacios y sin pasar
+    por json.dumps); msgpack evita además el texto de claves y números.
+    """
+
+    def __init__(self, content, status_code: int = 200, headers=None, media_type=None, background=None):
+        # render() se llama desde el constructor base: fijar antes el formato
+        self.response_format = response_format.get()
+        if media_type is None:
+            media_type = RESPONSE_MEDIA_TYPES[self.response_format]
+        super().__init__(content, status_code, headers, media_type, background)
+        self.headers.add_vary_header("Accept")
+
+    def render(self, content) -> bytes:
+        if self.response_format == "msgpack":
+            return msgpack.packb(content, use_bin_type=True)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content)
+        return super().render(content)
+
+# Métricas por ruta en formato Prometheus (GET /metrics)
+METRICS_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class PrometheusHistogram:
+    """Histograma acumulativo con buckets fijos por combinación de etiquetas"""
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.series = {}  # etiquetas -> [conteos por bucket, suma, total]
+
+    def observe(self, labels: tuple, value: float) -> None:
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [[0] * len(self.buckets), 0.0, 0]
+        counts = series[0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        series[1] += value
+        series[2] += 1
+
+    def render(self, name: str, label_names: tuple) -> list:
+        # Límites exactos ("1048576.0", no "1.04858e+06"), como prometheus_client
+        lines = []
+        for labels, (counts, total_sum, total_count) in sorted(self.series.items()):
+            label_text = ",".join(f'{key}="{value}"' for key, value in zip(label_names, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{label_text},le="{float(bound)!r}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label_text},le="+Inf"}} {total_count}')
+            lines.append(f"{name}_sum{{{label_text}}} {total_sum:.6f}")
+            lines.append(f"{name}_count{{{label_text}}} {total_count}")
+        return lines
+
+class RequestMetrics:
+    """
+    Latencia, tamaño de respuesta, peticiones y en curso por ruta
+
+    Las rutas se etiquetan con su plantilla (/logs/stream, no la URL real)
+    para acotar la cardinalidad. Todo se actualiza desde el event loop, así
+    que no hace falta bloqueo; con varios workers cada proceso expone sus
+    propias métricas.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.latency = PrometheusHistogram(METRICS_LATENCY_BUCKETS)
+        self.response_size = PrometheusHistogram(METRICS_SIZE_BUCKETS)
+        self.requests = {}  # (método, ruta, status) -> total
+        self.in_flight = {}  # (método, ruta) -> en curso
+
+    def observe(self, method: str, route: str, status: int, duration: float, size: int) -> None:
+        self.latency.observe((method, route), duration)
+        self.response_size.observe((method, route), size)
+        key = (method, route, str(status))
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+    def render(self) -> str:
+        lines = [
+            "# HELP orus_http_requests_total Peticiones HTTP completadas",
+            "# TYPE orus_http_requests_total counter",
+        ]
+        for (method, route, status), total in sorted(self.requests.items()):
+            lines.append(f'orus_http_requests_total{{method="{method}",route="{route}",status="{status}"}} {total}')
+
+        lines += [
+            "# HELP orus_http_requests_in_flight Peticiones HTTP en curso",
+            "# TYPE orus_http_requests_in_flight gauge",
+        ]
+        for (method, route), current in sorted(self.in_flight.items()):
+            lines.append(f'orus_http_requests_in_flight{{method="{method}",route="{route}"}} {current}')
+
+        lines += [
+            "# HELP orus_http_request_duration_seconds Latencia de las peticiones HTTP",
+            "# TYPE orus_http_request_duration_seconds histogram",
+        ]
+        lines += self.latency.render("orus_http_request_duration_seconds", ("method", "route"))
+
+        lines += [
+            "# HELP orus_http_response_size_bytes Tamaño del cuerpo de las respuestas HTTP",
+            "# TYPE orus_http_response_size_bytes histogram",
+        ]
+        lines += self.response_size.render("orus_http_response_size_bytes", ("method", "route"))
+
+        lines += [
+            "# HELP orus_process_start_time_seconds Inicio del proceso (epoch)",
+            "# TYPE orus_process_start_time_seconds gauge",
+            f"orus_process_start_time_seconds {self.started:.3f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+request_metrics = RequestMetrics()
+
+class TimingMiddleware:
+    """
+    Middleware ASGI que mide cada petición HTTP
+
+    La latencia cubre hasta el último fragmento del cuerpo, así que en
+    /logs/stream y /query/batch incluye todo el streaming.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    def route_template(self, scope) -> str:
+        partial = None
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            if match == Match.PARTIAL and partial is None:
+                partial = route.path
+        return partial or "unmatched"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = self.route_template(scope)
+        flight_key = (method, route)
+        in_flight = self.metrics.in_flight
+        in_flight[flight_key] = in_flight.get(flight_key, 0) + 1
+        status = 500
+        size = 0
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight[flight_key] -= 1
+            self.metrics.observe(method, route, status, time.perf_counter() - started, size)
+
 app = FastAPI(
     title="ORUS API",
     description="API REST para el sistema ORUS",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=NegotiatedResponse
 )
 
 # Configurar CORS
@@ -34,9 +684,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ContentNegotiationMiddleware)
+# El último middleware añadido es el más externo: mide también CORS y negociación
+app.add_middleware(TimingMiddleware, metrics=request_metrics)
 
 @app.get("/")
-def root():
+async def root():
     """Endpoint principal"""
     return {
         "message": "ORUS API - Sistema Cognitivo Distribuido",
@@ -45,7 +698,7 @@ def root():
     }
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Verificar salud del sistema"""
     return {
         "status": "ok",
@@ -55,35 +708,76 @@ def health_check():
     }
 
 @app.post("/query")
-def query_orus(data: dict):
+async def query_orus(data: dict):
     """Endpoint principal para consultas a ORUS"""
-    try:
-        text = data.get("text", "")
-        source = data.get("source", "unknown")
-        
-        # Simulación de procesamiento (aquí iría la lógica real de ORUS)
-        response_text = f"ORUS ha procesado: '{text}' desde {source}"
-        
+    return await process_query(data)
+
+@app.post("/query/batch")
+async def query_orus_batch(data: dict):
+    """Procesar varias consultas en una sola petición"""
+    queries = data.get("queries")
+    if not isinstance(queries, list):
         return {
-            "status": "ok",
-            "message": response_text,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "source": source
+            "status": "error",
+            "error": "Se esperaba una lista en 'queries'",
+            "timestamp": datetime.utcnow().isoformat() + "Z"
         }
-    except Exception as e:
+    
+    if len(queries) > QUERY_BATCH_MAX:
         return {
             "status": "error",
-            "error": str(e),
+            "error": f"Demasiadas consultas: {len(queries)} (máximo {QUERY_BATCH_MAX})",
             "timestamp": datetime.utcnow().isoformat() + "Z"
         }
+    
+    default_source = data.get("source", "unknown")
+    queries = [
+        query if isinstance(query, dict) else {"text": str(query), "source": default_source}
+        for query in queries
+    ]
+    
+    if data.get("stream", len(queries) > QUERY_BATCH_STREAM_THRESHOLD):
+        return StreamingResponse(
+            stream_query_batch(queries),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
+    results = await asyncio.gather(*(process_query(query) for query in queries))
+    return {
+        "status": "ok",
+        "total": len(results),
+        "results": results,
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+
+@app.get("/query/cache")
+async def get_query_cache_stats():
+    """Estadísticas de la caché de /query"""
+    if query_cache is None:
+        return {"status": "error", "error": "Query cache not available"}
+    return {"status": "ok", **query_cache.stats()}
+
+@app.delete("/query/cache")
+async def invalidate_query_cache(text: str = None, source: str = "unknown"):
+    """Invalidar una consulta en caché (o toda la caché si no se indica texto)"""
+    if query_cache is None:
+        return {"status": "error", "error": "Query cache not available"}
+    key = make_query_key(text, source) if text is not None else None
+    return {"status": "ok", "invalidated": query_cache.invalidate(key)}
 
 @app.get("/time")
-def get_time():
+async def get_time():
     """Devuelve la hora actual del servidor."""
     return {"status": "ok", "server_time": datetime.utcnow().isoformat() + "Z"}
 
+@app.get("/metrics")
+async def get_metrics():
+    """Métricas por ruta en formato de texto de Prometheus"""
+    return Response(request_metrics.render(), media_type=PROMETHEUS_MEDIA_TYPE)
+
 @app.get("/logs")
-def get_logs_analysis():
+async def get_logs_analysis():
     """Análisis de logs del sistema ORUS"""
     if not LOG_ANALYZER_AVAILABLE:
         return {
@@ -93,8 +787,8 @@ def get_logs_analysis():
         }
     
     try:
-        analyzer = LogAnalyzer()
-        result = analyzer.analyze_all_logs()
+        async with route_limits["logs"]:
+            result = await run_blocking(log_analysis_cache.get)
         
         return {
             "status": "ok",
@@ -111,5 +805,135 @@ def get_logs_analysis():
             "timestamp": datetime.utcnow().isoformat() + "Z"
         }
 
+@app.get("/logs/stream")
+async def stream_logs_analysis(format: str = "ndjson"):
+    """Análisis de logs en streaming (NDJSON o SSE)"""
+    if not LOG_ANALYZER_AVAILABLE:
+        return {
+            "status": "error",
+            "error": "Log analyzer module not available",
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }
+    
+    if format not in STREAM_MEDIA_TYPES:
+        return {
+            "status": "error",
+            "error": f"Formato no soportado: {format} (usar 'ndjson' o 'sse')",
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }
+    
+    return StreamingResponse(
+        stream_log_errors(format),
+        media_type=STREAM_MEDIA_TYPES[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/logs/follow")
+async def follow_logs():
+    """Errores de logs en vivo mediante Server-Sent Events"""
+    if not LOG_ANALYZER_AVAILABLE:
+        return {
+            "status": "error",
+            "error": "Log analyzer module not available",
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }
+    
+    async def event_stream():
+        # Suscribirse dentro del generador: si el cliente se desconecta antes
+        # de la primera iteración no queda una cola (ni el hilo) sin liberar
+        queue = log_broadcaster.subscribe()
+        try:
+            while True:
+                try:
+                    error = await asyncio.wait_for(queue.get(), timeout=LOGS_FOLLOW_KEEPALIVE)
+                    yield f"event: log_error\ndata: {json.dumps(error, ensure_ascii=False)}\n\n"
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            log_broadcaster.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def detect_server_backends() -> dict:
+    """Elegir uvloop/httptools si están instalados"""
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11"
+    }
+
+def create_reuseport_socket(host: str, port: int) -> socket.socket:
+    """Crear un socket de escucha con SO_REUSEPORT para repartir conexiones"""
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+def serve_worker(host: str, port: int) -> None:
+    """Proceso worker: socket propio con SO_REUSEPORT y servidor uvicorn"""
+    if log_analysis_cache is not None:
+        log_analysis_cache.shared_file = os.environ.get("ORUS_LOGS_CACHE_FILE")
+    
+    config = uvicorn.Config(app, **detect_server_backends())
+    uvicorn.Server(config).run(sockets=[create_reuseport_socket(host, port)])
+
+def run_production(host: str = "0.0.0.0", port: int = 8085, workers: int = 1) -> None:
+    """
+    Lanzar la API en producción con N procesos worker
+    
+    Cada worker abre su propio socket con SO_REUSEPORT y el kernel reparte
+    las conexiones entre ellos. La caché de /logs se comparte mediante
+    ORUS_LOGS_CACHE_FILE.
+    
+    Args:
+        host: Dirección de escucha
+        port: Puerto de escucha
+        workers: Número de procesos worker
+    """
+    backends = detect_server_backends()
+    
+    if workers <= 1 or not hasattr(socket, "SO_REUSEPORT"):
+        if workers > 1:
+            print("⚠️  SO_REUSEPORT no disponible, iniciando un solo proceso")
+        uvicorn.run(app, host=host, port=port, **backends)
+        return
+    
+    os.environ.setdefault(
+        "ORUS_LOGS_CACHE_FILE",
+        os.path.join(tempfile.gettempdir(), f"orus_logs_cache_{port}.json")
+    )
+    print(f"🚀 ORUS API: {workers} workers en {host}:{port} ({backends['loop']}/{backends['http']})")
+    
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=serve_worker, args=(host, port), name=f"orus-api-worker-{i}")
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    
+    def shutdown(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+    
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+    
+    for process in processes:
+        process.join()
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8085)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="ORUS API")
+    parser.add_argument("--host", default=os.environ.get("ORUS_API_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("ORUS_API_PORT", "8085")))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("ORUS_API_WORKERS", "1")))
+    args = parser.parse_args()
+    
+    run_production(args.host, args.port, args.workers)
\ No newline at end of file
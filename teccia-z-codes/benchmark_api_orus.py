@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+ORUS API - Benchmark de carga y latencia
+Mide throughput y latencia (p50/p95/p99) de /health, /time, /query y /logs
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from orus_client.async_transports import AsyncHTTPConnection
+
+# Cabecera Accept de cada formato de respuesta negociable
+ACCEPT_FORMATS = {
+    "json": "application/json",
+    "msgpack": "application/msgpack",
+}
+
+# Peticiones de cada endpoint: (método, ruta, cuerpo JSON)
+ENDPOINTS = {
+    "health": ("GET", "/health", None),
+    "time": ("GET", "/time", None),
+    "query": ("POST", "/query", {"text": "ORUS, benchmark", "source": "TECCIA-Z-Benchmark"}),
+    "logs": ("GET", "/logs", None),
+}
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por rango más cercano sobre valores ya ordenados"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+async def bench_endpoint(host: str, port: int, name: str, concurrency: int,
+                         total_requests: int, duration: Optional[float],
+                         response_format: str = "json") -> Dict[str, float]:
+    """
+    Ejecutar carga sobre un endpoint con `concurrency` conexiones keep-alive
+
+    Args:
+        host: Host del servidor
+        port: Puerto del servidor
+        name: Endpoint de ENDPOINTS
+        concurrency: Conexiones concurrentes
+        total_requests: Peticiones totales (si no se indica duración)
+        duration: Segundos de carga (tiene prioridad sobre total_requests)
+        response_format: Formato de respuesta pedido en Accept (ACCEPT_FORMATS)
+
+    Returns:
+        Métricas del endpoint
+    """
+    method, path, payload = ENDPOINTS[name]
+    body = json.dumps(payload).encode("utf-8") if payload is not None else None
+    headers = {"User-Agent": "TECCIA-Z-Benchmark/1.0", "Accept": ACCEPT_FORMATS[response_format]}
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+    latencies = []
+    errors = 0
+    bytes_received = 0
+    remaining = total_requests
+    deadline = time.perf_counter() + duration if duration else None
+
+    def next_request() -> bool:
+        nonlocal remaining
+        if deadline is not None:
+            return time.perf_counter() < deadline
+        if remaining <= 0:
+            return False
+        remaining -= 1
+        return True
+
+    async def worker():
+        nonlocal errors, bytes_received
+        connection = AsyncHTTPConnection(host, port)
+        try:
+            while next_request():
+                start = time.perf_counter()
+                try:
+                    status, _, response = await connection.request(method, path, body, headers)
+                    if status != 200:
+                        errors += 1
+                    bytes_received += len(response)
+                except Exception:
+                    errors += 1
+                    await connection.close()
+                    continue
+                latencies.append(time.perf_counter() - start)
+        finally:
+            await connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    completed = len(latencies)
+    return {
+        "requests": completed,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "rps": round(completed / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(latencies) / completed * 1000, 3) if completed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        "bytes_received": bytes_received,
+    }
+
+def start_in_process_server():
+    """Arrancar api_orus.app en un hilo sobre un puerto libre de localhost"""
+    import uvicorn
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "log-analyzer"))
+    from api_orus import app
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, name="orus-benchmark-server", daemon=True)
+    thread.start()
+
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("No se pudo arrancar api_orus en proceso")
+        time.sleep(0.05)
+
+    return server, thread, port
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    """Mostrar la tabla de resultados"""
+    print("=" * 86)
+    print(f"{'endpoint':<10}{'requests':>10}{'errors':>8}{'rps':>12}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'max ms':>11}")
+    print("-" * 86)
+    for name, r in results.items():
+        print(f"{name:<10}{r['requests']:>10}{r['errors']:>8}{r['rps']:>12.1f}"
+              f"{r['p50_ms']:>11.2f}{r['p95_ms']:>11.2f}{r['p99_ms']:>11.2f}{r['max_ms']:>11.2f}")
+    print("=" * 86)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de carga y latencia de ORUS API")
+    parser.add_argument("--url", help="URL de un servidor ya arrancado (por defecto se arranca api_orus en proceso)")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS),
+                        help=f"Endpoints separados por coma ({', '.join(ENDPOINTS)})")
+    parser.add_argument("--concurrency", type=int, default=16, help="Conexiones concurrentes por endpoint")
+    parser.add_argument("--requests", type=int, default=2000, help="Peticiones por endpoint")
+    parser.add_argument("--duration", type=float, help="Segundos de carga por endpoint (en lugar de --requests)")
+    parser.add_argument("--warmup", type=int, default=50, help="Peticiones de calentamiento por endpoint")
+    parser.add_argument("--format", choices=list(ACCEPT_FORMATS), default="json",
+                        help="Formato de respuesta a negociar con Accept")
+    parser.add_argument("--output", default="benchmark_api_orus.json", help="Archivo JSON de resultados")
+    args = parser.parse_args()
+
+    endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in endpoints if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f"Endpoints desconocidos: {', '.join(unknown)}")
+
+    server = thread = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+        target = args.url
+    else:
+        server, thread, port = start_in_process_server()
+        host = "127.0.0.1"
+        target = f"in-process http://{host}:{port}"
+
+    print(f"🧪 Benchmark ORUS API: {target} (concurrencia {args.concurrency})")
+
+    async def run_all():
+        results = {}
+        for name in endpoints:
+            if args.warmup:
+                await bench_endpoint(host, port, name, min(args.concurrency, args.warmup), args.warmup, None, args.format)
+            results[name] = await bench_endpoint(host, port, name, args.concurrency, args.requests, args.duration,
+                                                 args.format)
+            print(f"   ✅ {name}: {results[name]['rps']:.1f} req/s, p99 {results[name]['p99_ms']:.2f} ms")
+        return results
+
+    try:
+        results = asyncio.run(run_all())
+    finally:
+        if server is not None:
+            server.should_exit = True
+            thread.join(timeout=5)
+
+    print_results(results)
+
+    report = {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "target": target,
+        "concurrency": args.concurrency,
+        "format": args.format,
+        "requests_per_endpoint": None if args.duration else args.requests,
+        "duration_s": args.duration,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"📄 Resultados guardados en {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+ORUS Client - Presupuesto de arranque de la CLI
+Mide con `python3 -X importtime` lo que importan los scripts orus-api-client*.py
+y falla si se supera el presupuesto (para CI y sondas de cron)
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos de la ruta rápida de la CLI (petición delegada al daemon)
+CLI_MODULES = ["orus_client", "orus_client.cli", "orus_client.daemon"]
+
+DEFAULT_BUDGET_MS = 10.0
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Tiempo acumulado (µs) de cada import de primer nivel en la salida de -X importtime"""
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if name.startswith(" ") and not name.startswith("  "):  # primer nivel: un único espacio
+            cumulative = cumulative.strip()
+            if cumulative.isdigit():
+                totals[name.strip()] = int(cumulative)
+    return totals
+
+def measure_imports(code: str) -> Dict[str, int]:
+    """Ejecutar `code` en un intérprete nuevo con -X importtime"""
+    env = dict(os.environ, PYTHONPATH=HERE)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, env=env, check=True)
+    return parse_importtime(result.stderr)
+
+def import_overhead_ms(modules: List[str], runs: int) -> Tuple[float, Dict[str, int]]:
+    """
+    Mediana del coste de importar `modules` sobre un intérprete vacío
+
+    Returns:
+        (milisegundos, desglose por módulo de primer nivel de la última ejecución)
+    """
+    samples = []
+    breakdown = {}
+    for _ in range(runs):
+        baseline = measure_imports("pass")
+        target = measure_imports("; ".join(f"import {name}" for name in modules))
+        breakdown = {name: us for name, us in target.items() if name not in baseline}
+        samples.append((sum(target.values()) - sum(baseline.values())) / 1000)
+    return statistics.median(samples), breakdown
+
+def wall_time_ms(script: str, command: List[str], runs: int, daemon: bool) -> float:
+    """Mediana del tiempo total de `python3 <script> <command>`"""
+    env = dict(os.environ, ORUS_CLIENT_DAEMON="1" if daemon else "0")
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, script, *command], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, env=env)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description="Presupuesto de arranque de la CLI de ORUS")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Coste máximo de imports de la CLI en milisegundos")
+    parser.add_argument("--runs", type=int, default=5, help="Ejecuciones por medida (se usa la mediana)")
+    parser.add_argument("--script", help="Script a cronometrar de extremo a extremo (p. ej. orus-api-client-local.py)")
+    parser.add_argument("command", nargs="*", default=["health"], help="Comando para --script")
+    args = parser.parse_args()
+
+    overhead, breakdown = import_overhead_ms(CLI_MODULES, args.runs)
+    print(f"📦 Imports de la CLI: {overhead:.2f} ms (presupuesto {args.budget_ms:.2f} ms)")
+    for name, us in sorted(breakdown.items(), key=lambda item: -item[1]):
+        print(f"   {us / 1000:>7.2f} ms  {name}")
+
+    if args.script:
+        with_daemon = wall_time_ms(args.script, args.command, args.runs, daemon=True)
+        without_daemon = wall_time_ms(args.script, args.command, args.runs, daemon=False)
+        print(f"⏱️  {args.script} {' '.join(args.command)}: "
+              f"{with_daemon:.1f} ms con daemon, {without_daemon:.1f} ms sin daemon")
+
+    if overhead > args.budget_ms:
+        print("❌ Presupuesto de arranque superado")
+        sys.exit(1)
+    print("✅ Dentro del presupuesto de arranque")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+ORUS Log Analyzer - Benchmark de patrones
+Compara la búsqueda patrón por patrón con la alternancia combinada
+sobre un log sintético
+"""
+
+import random
+import sys
+import time
+from typing import List, Optional
+
+from log_analyzer import LogAnalyzer
+
+SAMPLE_LINES = [
+    "INFO: Procesando solicitud del cliente",
+    "DEBUG: Cache actualizada correctamente",
+    "INFO: Conectando a base de datos",
+    "WARNING: Reintentando conexión en 5 segundos",
+    "ERROR: Connection refused to database server",
+    "Exception: Null pointer en módulo X",
+    "CRITICAL: Memoria insuficiente",
+    "INFO: Request timeout configurado a 30s",
+    # Coincidencias solapadas: "timeout" y "traceback" comparten la "t"
+    "WARNING: timeoutraceback en worker 3",
+]
+
+def generate_lines(count: int, seed: int = 42) -> List[str]:
+    """Generar un log sintético con un ~10% de líneas de error"""
+    rng = random.Random(seed)
+    info_lines = SAMPLE_LINES[:4]
+    lines = []
+    for i in range(count):
+        pool = SAMPLE_LINES if rng.random() < 0.1 else info_lines
+        lines.append(f"2025-11-09T23:10:{i % 60:02d}.000Z {rng.choice(pool)}\n")
+    return lines
+
+def legacy_match(analyzer: LogAnalyzer, line: str) -> Optional[str]:
+    """Búsqueda original: un patrón compilado tras otro"""
+    for pattern in analyzer.compiled_patterns:
+        if pattern.search(line):
+            return pattern.pattern
+    return None
+
+def bench(label: str, func, lines: List[str]) -> float:
+    """Medir el tiempo de aplicar `func` a todas las líneas"""
+    start = time.perf_counter()
+    matches = sum(1 for line in lines if func(line.strip()) is not None)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:8.3f}s  {len(lines) / elapsed:12,.0f} líneas/s  ({matches} coincidencias)")
+    return elapsed
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    analyzer = LogAnalyzer()
+    lines = generate_lines(count)
+    
+    # Ambos métodos deben reportar el mismo patrón en cada línea
+    for line in lines[:10000]:
+        assert legacy_match(analyzer, line.strip()) == analyzer.match_error_pattern(line.strip())
+    
+    print(f"🧪 Benchmark de patrones sobre {count:,} líneas")
+    legacy = bench("por patrón", lambda line: legacy_match(analyzer, line), lines)
+    combined = bench("combinado", analyzer.match_error_pattern, lines)
+    print(f"⚡ Aceleración: {legacy / combined:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -4,28 +4,74 @@ ORUS Log Analyzer
 Analizador de logs para detectar errores y excepciones en el sistema ORUS
 """
 
+import io
+import json
 import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 import glob
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+# Tamaño de bloque para la lectura inversa de archivos (64 KB)
+TAIL_BLOCK_SIZE = 64 * 1024
+
+# Caracteres que convierten un patrón en una expresión regular (no literal)
+REGEX_METACHARS = set('.^$*+?{}[]\\|()')
+
+# Archivo por defecto para los checkpoints del modo incremental
+DEFAULT_CHECKPOINT_FILE = "/opt/modelscope-agent/data/log_analyzer_checkpoints.json"
+
+# Tipos de pool soportados para el análisis en paralelo
+EXECUTOR_TYPES = ("thread", "process")
+
+def _analyze_file_task(analyzer: "LogAnalyzer", file_path: str) -> Tuple[List[Dict[str, str]], Optional[Dict[str, int]]]:
+    """
+    Analizar un archivo dentro de un worker del pool
+    
+    Devuelve también el checkpoint actualizado, ya que en un pool de procesos
+    los cambios en `analyzer.checkpoints` no llegan al proceso principal.
+    """
+    errors = analyzer.analyze_log_file(file_path)
+    return errors, analyzer.checkpoints.get(os.path.abspath(file_path))
+
 class LogAnalyzer:
     """Clase principal para análisis de logs del sistema ORUS"""
     
-    def __init__(self, log_dirs: List[str] = None, lines_limit: int = 100):
+    def __init__(self, log_dirs: List[str] = None, lines_limit: int = 100,
+                 incremental: bool = False, checkpoint_file: str = None,
+                 max_workers: int = 1, executor_type: str = "thread"):
         """
         Inicializar el analizador de logs
         
         Args:
             log_dirs: Lista de directorios de logs a analizar
             lines_limit: Límite de líneas a leer por archivo (por defecto 100)
+            incremental: Analizar solo los bytes añadidos desde la última ejecución
+            checkpoint_file: Archivo JSON donde persistir los checkpoints incrementales
+            max_workers: Número de archivos a analizar en paralelo (1 = secuencial)
+            executor_type: Tipo de pool para el modo paralelo ("thread" o "process")
         """
+        if executor_type not in EXECUTOR_TYPES:
+            raise ValueError(f"executor_type debe ser uno de {EXECUTOR_TYPES}: {executor_type}")
+        
         self.log_dirs = log_dirs or [
             "/root/.pm2/logs/",
             "/opt/modelscope-agent/logs/"
         ]
         self.lines_limit = lines_limit
+        self.incremental = incremental
+        self.checkpoint_file = checkpoint_file or DEFAULT_CHECKPOINT_FILE
+        self.checkpoints = self.load_checkpoints() if incremental else {}
+        self.max_workers = max(1, max_workers or 1)
+        self.executor_type = executor_type
         
         # Patrones de error a buscar
         self.error_patterns = [
@@ -43,11 +89,18 @@ class LogAnalyzer:
         
         # Compilar patrones para mejor rendimiento
         self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.error_patterns]
+        
+        # Autómata único: cada línea se recorre una sola vez
+        self._build_combined_pattern()
     
     def read_last_lines(self, file_path: str, limit: int = None) -> List[str]:
         """
         Leer las últimas N líneas de un archivo
         
+        Lee bloques desde el final del archivo hacia atrás y se detiene al
+        reunir N líneas, por lo que la memoria depende del tamaño de la cola
+        y no del tamaño total del archivo.
+        
         Args:
             file_path: Ruta del archivo
             limit: Límite de líneas a leer
@@ -58,44 +111,300 @@ class LogAnalyzer:
         if not os.path.exists(file_path):
             return []
         
+        limit = limit or self.lines_limit
+        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                return lines[-(limit or self.lines_limit):]
+            with open(file_path, 'rb') as f:
+                tail = self._read_tail_bytes(f, limit)
         except Exception as e:
             print(f"Error leyendo archivo {file_path}: {e}")
             return []
+        
+        # Se decodifica la cola completa de una vez: las secuencias UTF-8
+        # partidas entre bloques quedan unidas antes de decodificar
+        text = tail.decode('utf-8', errors='ignore')
+        return io.StringIO(text, newline=None).readlines()[-limit:]
     
-    def find_errors_in_lines(self, lines: List[str], file_name: str) -> List[Dict[str, str]]:
+    def _read_tail_bytes(self, f, limit: int, end: Optional[int] = None) -> bytes:
         """
-        Buscar patrones de error en una lista de líneas
+        Leer hacia atrás desde EOF hasta reunir al menos `limit` líneas completas
         
         Args:
-            lines: Líneas a analizar
-            file_name: Nombre del archivo para referencia
+            f: Archivo abierto en modo binario
+            limit: Número de líneas requeridas
+            end: Byte desde el que leer hacia atrás (por defecto, EOF)
             
         Returns:
-            Lista de errores encontrados
+            Bytes de la cola del archivo (hasta `end`), comenzando en inicio de línea
+        """
+        if end is None:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+        position = end
+        blocks = []
+        newlines = 0
+        
+        # Se necesita un salto de línea más que `limit` para garantizar que
+        # la primera línea de la cola esté completa
+        while position > 0 and newlines <= limit:
+            read_size = min(TAIL_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size)
+            newlines += block.count(b'\n')
+            blocks.append(block)
+        
+        tail = b''.join(reversed(blocks))
+        
+        # Descartar la línea parcial inicial si no se llegó al inicio del archivo
+        if position > 0:
+            tail = tail[tail.find(b'\n') + 1:]
+        
+        return tail
+    
+    def load_checkpoints(self) -> Dict[str, Dict[str, int]]:
+        """
+        Cargar los checkpoints (inode, offset, size) guardados en disco
+        
+        Returns:
+            Diccionario ruta -> checkpoint (vacío si no existe o es inválido)
+        """
+        if not os.path.exists(self.checkpoint_file):
+            return {}
+        
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            print(f"⚠️  Checkpoints inválidos en {self.checkpoint_file}: {e}")
+            return {}
+    
+    def save_checkpoints(self) -> None:
+        """Guardar los checkpoints en disco de forma atómica"""
+        try:
+            checkpoint_dir = os.path.dirname(self.checkpoint_file)
+            if checkpoint_dir:
+                os.makedirs(checkpoint_dir, exist_ok=True)
+            
+            tmp_file = f"{self.checkpoint_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.checkpoints, f, indent=2)
+            os.replace(tmp_file, self.checkpoint_file)
+        except Exception as e:
+            print(f"Error guardando checkpoints {self.checkpoint_file}: {e}")
+    
+    def read_new_lines(self, file_path: str) -> List[str]:
+        """
+        Leer solo las líneas añadidas desde el último checkpoint
+        
+        La primera vez que se ve un archivo se leen sus últimas `lines_limit`
+        líneas. Si el inode cambió (rotación) o el archivo es más pequeño que
+        el offset guardado (truncado), se trata como un archivo nuevo: solo se
+        leen sus últimas `lines_limit` líneas, para no cargar en memoria un log
+        rotado de varios GB. Las líneas incompletas al final se dejan para la
+        siguiente ejecución.
+        
+        Args:
+            file_path: Ruta del archivo
+            
+        Returns:
+            Lista de líneas nuevas del archivo
+        """
+        if not os.path.exists(file_path):
+            return []
+        
+        key = os.path.abspath(file_path)
+        
+        try:
+            stat = os.stat(file_path)
+            checkpoint = self.checkpoints.get(key)
+            
+            offset = checkpoint.get('offset', 0) if checkpoint is not None else 0
+            if (checkpoint is None or checkpoint.get('inode') != stat.st_ino
+                    or stat.st_size < offset):
+                lines, offset = self._read_last_complete_lines(file_path, stat.st_size)
+            else:
+                lines, offset = self._read_appended_lines(file_path, offset, stat.st_size)
+            
+            self.checkpoints[key] = {
+                'inode': stat.st_ino,
+                'offset': offset,
+                'size': stat.st_size
+            }
+            return lines
+        except Exception as e:
+            print(f"Error leyendo archivo {file_path}: {e}")
+            return []
+    
+    def _read_last_complete_lines(self, file_path: str, size: int) -> Tuple[List[str], int]:
+        """
+        Leer las últimas `lines_limit` líneas completas hasta `size`
+        
+        Una línea final sin salto de línea se está escribiendo todavía: no se
+        devuelve y el offset queda al inicio de ella para leerla entera después.
+        
+        Returns:
+            Tupla (líneas leídas, offset tras la última línea completa)
+        """
+        with open(file_path, 'rb') as f:
+            tail = self._read_tail_bytes(f, self.lines_limit, end=size)
+        
+        end = tail.rfind(b'\n') + 1
+        text = tail[:end].decode('utf-8', errors='ignore')
+        lines = io.StringIO(text, newline=None).readlines()[-self.lines_limit:]
+        return lines, size - len(tail) + end
+    
+    def _read_appended_lines(self, file_path: str, offset: int, size: int) -> Tuple[List[str], int]:
+        """
+        Leer las líneas completas entre `offset` y `size`
+        
+        Se lee por bloques de TAIL_BLOCK_SIZE: solo se guarda en memoria el
+        bloque en curso (además de las líneas devueltas).
+        
+        Args:
+            file_path: Ruta del archivo
+            offset: Byte desde el que leer
+            size: Tamaño actual del archivo
+            
+        Returns:
+            Tupla (líneas leídas, nuevo offset tras la última línea completa)
+        """
+        lines = []
+        remainder = b''
+        position = offset
+        with open(file_path, 'rb') as f:
+            f.seek(offset)
+            while position < size:
+                chunk = f.read(min(TAIL_BLOCK_SIZE, size - position))
+                if not chunk:
+                    break
+                position += len(chunk)
+                
+                # Consumir solo hasta el último salto de línea completo; el
+                # resto se une al bloque siguiente
+                data = remainder + chunk
+                end = data.rfind(b'\n') + 1
+                if end:
+                    text = data[:end].decode('utf-8', errors='ignore')
+                    lines.extend(io.StringIO(text, newline=None).readlines())
+                remainder = data[end:]
+        
+        return lines, position - len(remainder)
+    
+    def _build_combined_pattern(self) -> None:
+        """
+        Compilar todos los patrones de error en una sola alternancia
+        
+        Si todos los patrones son literales se compila una alternancia de
+        literales en minúsculas (el motor de `re` la optimiza mucho mejor que
+        una con grupos nombrados e IGNORECASE) y el texto coincidente indica
+        el patrón. En caso contrario se usa una alternancia con grupos
+        nombrados `p<i>` e IGNORECASE.
+        """
+        if all(not (set(pattern) & REGEX_METACHARS) for pattern in self.error_patterns):
+            self._literal_index = {}
+            for i, pattern in enumerate(self.error_patterns):
+                self._literal_index.setdefault(pattern.lower(), i)
+            
+            # Literales más largos primero para que ganen en la misma posición
+            literals = sorted(self._literal_index, key=len, reverse=True)
+            self.combined_pattern = re.compile('|'.join(re.escape(literal) for literal in literals))
+        else:
+            self._literal_index = None
+            self.combined_pattern = re.compile(
+                '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(self.error_patterns)),
+                re.IGNORECASE
+            )
+    
+    def match_error_pattern(self, line: str) -> Optional[str]:
         """
-        errors = []
+        Buscar el patrón de error que coincide con una línea
         
+        Usa la alternancia combinada en una sola pasada. Si coinciden varios
+        patrones se devuelve el de mayor prioridad (el primero en
+        `error_patterns`), igual que al probarlos uno a uno. Como `finditer`
+        no devuelve coincidencias solapadas ("timeoutraceback" solo da
+        "timeout"), los patrones de más prioridad que el mejor encontrado se
+        comprueban después uno a uno; esto solo ocurre en líneas con error.
+        
+        Args:
+            line: Línea a analizar
+            
+        Returns:
+            Patrón que coincidió o None
+        """
+        literal_index = self._literal_index
+        text = line.lower() if literal_index is not None else line
+        
+        best = None
+        for match in self.combined_pattern.finditer(text):
+            if literal_index is not None:
+                index = literal_index[match.group()]
+            else:
+                index = int(match.lastgroup[1:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        
+        if best is None:
+            return None
+        
+        # Un patrón de más prioridad puede haber quedado dentro de otra coincidencia
+        for index in range(best):
+            if literal_index is not None:
+                if self.error_patterns[index].lower() in text:
+                    return self.error_patterns[index]
+            elif self.compiled_patterns[index].search(line):
+                return self.error_patterns[index]
+        return self.error_patterns[best]
+    
+    def iter_errors_in_lines(self, lines: Iterable[str], file_name: str) -> Iterator[Dict[str, str]]:
+        """
+        Buscar patrones de error en líneas, devolviendo cada error al encontrarlo
+        
+        Args:
+            lines: Líneas a analizar
+            file_name: Nombre del archivo para referencia
+            
+        Yields:
+            Errores encontrados, uno por línea como máximo
+        """
         for line_num, line in enumerate(lines, 1):
             line_content = line.strip()
             if not line_content:
                 continue
                 
-            for pattern in self.compiled_patterns:
-                if pattern.search(line_content):
-                    errors.append({
-                        'file': file_name,
-                        'line_number': line_num,
-                        'content': line_content,
-                        'pattern': pattern.pattern,
-                        'timestamp': datetime.now().isoformat() + "Z"
-                    })
-                    break  # Solo registrar una vez por línea
-        
-        return errors
+            # Solo se registra una vez por línea
+            pattern = self.match_error_pattern(line_content)
+            if pattern is not None:
+                yield {
+                    'file': file_name,
+                    'line_number': line_num,
+                    'content': line_content,
+                    'pattern': pattern,
+                    'timestamp': datetime.now().isoformat() + "Z"
+                }
+    
+    def find_errors_in_lines(self, lines: List[str], file_name: str) -> List[Dict[str, str]]:
+        """
+        Buscar patrones de error en una lista de líneas
+        
+        Args:
+            lines: Líneas a analizar
+            file_name: Nombre del archivo para referencia
+            
+        Returns:
+            Lista de errores encontrados
+        """
+        return list(self.iter_errors_in_lines(lines, file_name))
+    
+    def _read_file_lines(self, file_path: str) -> List[str]:
+        """Leer las líneas a analizar según el modo (cola o incremental)"""
+        if self.incremental:
+            return self.read_new_lines(file_path)
+        return self.read_last_lines(file_path)
     
     def analyze_log_file(self, file_path: str) -> List[Dict[str, str]]:
         """
@@ -108,40 +417,108 @@ class LogAnalyzer:
             Lista de errores encontrados en el archivo
         """
         file_name = os.path.basename(file_path)
-        lines = self.read_last_lines(file_path)
-        return self.find_errors_in_lines(lines, file_name)
+        return self.find_errors_in_lines(self._read_file_lines(file_path), file_name)
     
-    def analyze_all_logs(self) -> Dict[str, any]:
+    def iter_errors(self) -> Iterator[Dict[str, str]]:
         """
-        Analizar todos los logs en los directorios configurados
+        Analizar todos los logs devolviendo los errores a medida que aparecen
+        
+        Versión en streaming de `analyze_all_logs`: los archivos se procesan
+        uno a uno y nunca se acumula la lista completa de errores.
+        
+        Yields:
+            Errores encontrados en los directorios configurados
+        """
+        log_files, _ = self.collect_log_files()
+        
+        for log_file in log_files:
+            file_name = os.path.basename(log_file)
+            yield from self.iter_errors_in_lines(self._read_file_lines(log_file), file_name)
         
+        if self.incremental:
+            self.save_checkpoints()
+    
+    def collect_log_files(self, verbose: bool = True) -> Tuple[List[str], List[str]]:
+        """
+        Buscar los archivos .log de los directorios configurados
+        
+        Args:
+            verbose: Avisar por consola de los directorios no encontrados
+            
         Returns:
-            Diccionario con resultados del análisis
+            Tupla (archivos encontrados, directorios omitidos)
         """
-        all_errors = []
-        analyzed_files = []
+        log_files = []
         skipped_files = []
         
         for log_dir in self.log_dirs:
             if not os.path.exists(log_dir):
-                print(f"⚠️  Directorio no encontrado: {log_dir}")
+                if verbose:
+                    print(f"⚠️  Directorio no encontrado: {log_dir}")
                 skipped_files.append(f"{log_dir} (directorio no existe)")
                 continue
             
             # Buscar todos los archivos .log en el directorio
-            log_files = glob.glob(os.path.join(log_dir, "*.log"))
+            dir_files = glob.glob(os.path.join(log_dir, "*.log"))
             
-            if not log_files:
+            if not dir_files:
                 skipped_files.append(f"{log_dir} (sin archivos .log)")
                 continue
             
+            log_files.extend(dir_files)
+        
+        return log_files, skipped_files
+    
+    def _create_executor(self):
+        """Crear el pool de workers según `executor_type`"""
+        if self.executor_type == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+    
+    def analyze_all_logs(self) -> Dict[str, any]:
+        """
+        Analizar todos los logs en los directorios configurados
+        
+        Con `max_workers` > 1 los archivos se reparten en un pool de hilos o
+        procesos; los resultados se combinan en el orden de los archivos.
+        
+        Returns:
+            Diccionario con resultados del análisis
+        """
+        all_errors = []
+        analyzed_files = []
+        log_files, skipped_files = self.collect_log_files()
+        
+        if self.max_workers > 1 and len(log_files) > 1:
+            with self._create_executor() as executor:
+                futures = [executor.submit(_analyze_file_task, self, log_file) for log_file in log_files]
+                outcomes = []
+                for future in futures:
+                    try:
+                        outcomes.append(future.result())
+                    except Exception as e:
+                        outcomes.append(e)
+        else:
+            outcomes = []
             for log_file in log_files:
                 try:
-                    file_errors = self.analyze_log_file(log_file)
-                    all_errors.extend(file_errors)
-                    analyzed_files.append(os.path.basename(log_file))
+                    outcomes.append(_analyze_file_task(self, log_file))
                 except Exception as e:
-                    skipped_files.append(f"{os.path.basename(log_file)} (error: {str(e)})")
+                    outcomes.append(e)
+        
+        for log_file, outcome in zip(log_files, outcomes):
+            if isinstance(outcome, Exception):
+                skipped_files.append(f"{os.path.basename(log_file)} (error: {str(outcome)})")
+                continue
+            
+            file_errors, checkpoint = outcome
+            all_errors.extend(file_errors)
+            analyzed_files.append(os.path.basename(log_file))
+            if checkpoint is not None:
+                self.checkpoints[os.path.abspath(log_file)] = checkpoint
+        
+        if self.incremental:
+            self.save_checkpoints()
         
         return {
             'timestamp': datetime.now().isoformat() + "Z",
@@ -150,9 +527,79 @@ class LogAnalyzer:
             'analyzed_files': analyzed_files,
             'skipped_files': skipped_files,
             'log_directories': self.log_dirs,
-            'lines_limit': self.lines_limit
+            'lines_limit': self.lines_limit,
+            'incremental': self.incremental
         }
     
+    def follow(self, poll_interval: float = 1.0,
+               stop_event: Optional[threading.Event] = None) -> Iterator[Dict[str, str]]:
+        """
+        Seguir los logs en vivo (como `tail -F`) y devolver los errores nuevos
+        
+        Los archivos existentes se siguen desde su final y los que se crean
+        después desde el inicio; la rotación y el truncado se detectan por
+        inode y tamaño. Con `inotify_simple` instalado se espera a eventos del
+        kernel; si no, se comprueba el tamaño de los archivos cada
+        `poll_interval` segundos.
+        
+        Args:
+            poll_interval: Segundos entre comprobaciones (o timeout de inotify)
+            stop_event: Evento para detener el seguimiento
+            
+        Yields:
+            Errores encontrados en las líneas nuevas
+        """
+        stop_event = stop_event or threading.Event()
+        positions = {}
+        
+        log_files, _ = self.collect_log_files()
+        for log_file in log_files:
+            try:
+                stat = os.stat(log_file)
+                positions[log_file] = (stat.st_ino, stat.st_size)
+            except OSError:
+                continue
+        
+        inotify = None
+        if INOTIFY_AVAILABLE:
+            inotify = INotify()
+            watch_mask = inotify_flags.MODIFY | inotify_flags.CREATE | inotify_flags.MOVED_TO
+            for log_dir in self.log_dirs:
+                if os.path.isdir(log_dir):
+                    inotify.add_watch(log_dir, watch_mask)
+        
+        try:
+            while not stop_event.is_set():
+                if inotify is not None:
+                    inotify.read(timeout=int(poll_interval * 1000))
+                else:
+                    stop_event.wait(poll_interval)
+                
+                if stop_event.is_set():
+                    break
+                
+                log_files, _ = self.collect_log_files(verbose=False)
+                for log_file in log_files:
+                    try:
+                        stat = os.stat(log_file)
+                        inode, offset = positions.get(log_file, (stat.st_ino, 0))
+                        if inode != stat.st_ino or stat.st_size < offset:
+                            offset = 0
+                        
+                        if stat.st_size > offset:
+                            lines, offset = self._read_appended_lines(log_file, offset, stat.st_size)
+                        else:
+                            lines = []
+                        positions[log_file] = (stat.st_ino, offset)
+                    except OSError as e:
+                        print(f"Error leyendo archivo {log_file}: {e}")
+                        continue
+                    
+                    yield from self.iter_errors_in_lines(lines, os.path.basename(log_file))
+        finally:
+            if inotify is not None:
+                inotify.close()
+    
     def get_summary(self, analysis_result: Dict[str, any]) -> str:
         """
         Generar un resumen legible del análisis
@@ -186,7 +633,15 @@ class LogAnalyzer:
 
 def main():
     """Función principal para ejecución desde línea de comandos"""
-    analyzer = LogAnalyzer()
+    max_workers = 1
+    if '--workers' in sys.argv:
+        max_workers = int(sys.argv[sys.argv.index('--workers') + 1])
+    
+    analyzer = LogAnalyzer(
+        incremental='--incremental' in sys.argv,
+        max_workers=max_workers,
+        executor_type="process" if '--processes' in sys.argv else "thread"
+    )
     result = analyzer.analyze_all_logs()
     print(analyzer.get_summary(result))
     
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+ORUS Log Analyzer - Pruebas del modo incremental
+Ejecutar desde este directorio con: python3 -m unittest test_log_analyzer
+"""
+
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+from log_analyzer import TAIL_BLOCK_SIZE, LogAnalyzer
+
+class IncrementalReadTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.tmp_dir, "app.log")
+        self.analyzer = LogAnalyzer(
+            [self.tmp_dir], lines_limit=10, incremental=True,
+            checkpoint_file=os.path.join(self.tmp_dir, "checkpoints.json")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, text: str, mode: str = "a") -> None:
+        with open(self.log_file, mode) as f:
+            f.write(text)
+
+    def write_large(self, size: int, mode: str = "w") -> None:
+        line = "INFO: línea de relleno del log rotado\n"
+        with open(self.log_file, mode) as f:
+            for _ in range(size // len(line) + 1):
+                f.write(line)
+
+    def test_partial_line_is_read_whole_on_next_run(self):
+        self.write("x ERROR one\npartial ERR", mode="w")
+        self.assertEqual(self.analyzer.read_new_lines(self.log_file), ["x ERROR one\n"])
+        self.write("OR two\n")
+        self.assertEqual(self.analyzer.read_new_lines(self.log_file), ["partial ERROR two\n"])
+
+    def test_appended_lines_across_blocks(self):
+        self.write("", mode="w")
+        self.analyzer.read_new_lines(self.log_file)
+        expected = [f"línea {i} " + "x" * 100 + "\n" for i in range(3 * TAIL_BLOCK_SIZE // 100)]
+        self.write("".join(expected) + "sin terminar")
+        self.assertEqual(self.analyzer.read_new_lines(self.log_file), expected)
+        self.assertEqual(self.analyzer.read_new_lines(self.log_file), [])
+
+    def test_rotated_large_file_read_is_bounded(self):
+        self.write_large(1024 * 1024)
+        self.analyzer.read_new_lines(self.log_file)
+
+        # Rotación: el archivo se renombra y se crea uno nuevo (otro inode) grande
+        os.rename(self.log_file, self.log_file + ".1")
+        self.write_large(32 * 1024 * 1024)
+        self.write("ERROR: tras la rotación\n")
+
+        tracemalloc.start()
+        try:
+            lines = self.analyzer.read_new_lines(self.log_file)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(lines[-1], "ERROR: tras la rotación\n")
+        # Un bloque de cola y sus líneas decodificadas, no los 32 MB del archivo
+        self.assertLess(peak, 2 * 1024 * 1024)
+        self.assertEqual(self.analyzer.checkpoints[os.path.abspath(self.log_file)]["offset"],
+                         os.path.getsize(self.log_file))
+
+    def test_truncated_file_read_is_bounded(self):
+        self.write_large(1024 * 1024)
+        self.analyzer.read_new_lines(self.log_file)
+
+        self.write_large(512 * 1024)  # mismo inode, más pequeño que el offset guardado
+        lines = self.analyzer.read_new_lines(self.log_file)
+        self.assertEqual(len(lines), 10)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+TECCIA-Z ORUS API Client - Async Version
+Cliente asíncrono con envío concurrente de consultas en lote
+"""
+
+import os
+import sys
+
+# Cliente asíncrono compartido (teccia-z-codes/orus_client)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from orus_client.async_client import AsyncORUSAPIClient, main
+
+__all__ = ['AsyncORUSAPIClient', 'main']
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+ORUS Client Package
+Cliente unificado (síncrono y asíncrono) para la API REST de ORUS
+
+Los submódulos se cargan bajo demanda para que los scripts de la CLI no
+paguen en el arranque por http.client, asyncio o json si no los usan.
+"""
+
+import importlib
+
+from .defaults import LOCAL_BASE_URL, PRODUCTION_BASE_URL
+
+__version__ = "1.0.0"
+__author__ = "TECCIA-Z Development Team"
+__description__ = "Cliente de la API REST de ORUS con transportes intercambiables"
+
+# Nombre exportado -> submódulo que lo define
+_LAZY_EXPORTS = {
+    'ORUSAPIClient': 'client',
+    'decode_response': 'client',
+    'AsyncORUSAPIClient': 'async_client',
+    'UrllibTransport': 'transports',
+    'PooledHTTPTransport': 'transports',
+    'create_transport': 'transports',
+    'AsyncPooledHTTPTransport': 'async_transports',
+    'TTLLRUCache': 'cache',
+    'make_query_key': 'cache',
+    'CircuitBreaker': 'resilience',
+    'CircuitOpenError': 'resilience',
+    'RetryPolicy': 'resilience',
+    'call_with_retry': 'resilience',
+    'print_response': 'cli',
+    'run_cli': 'cli',
+    'call_daemon': 'daemon',
+    'serve_daemon': 'daemon',
+    'LatencyHistogram': 'watch',
+}
+
+__all__ = ['PRODUCTION_BASE_URL', 'LOCAL_BASE_URL', *_LAZY_EXPORTS]
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,118 @@
+"""
+ORUS Client - Cliente asíncrono
+Cliente asíncrono con envío concurrente de consultas en lote
+"""
+
+import asyncio
+import json
+import sys
+from typing import Iterable, List
+
+from .client import DEFAULT_RESPONSE_FORMAT, decode_response, encode_request, error_response
+from .defaults import LOCAL_BASE_URL
+from .async_transports import AsyncPooledHTTPTransport
+
+class AsyncORUSAPIClient:
+    """Cliente ORUS asíncrono sobre un pool compartido de conexiones keep-alive"""
+
+    def __init__(self, base_url: str = LOCAL_BASE_URL, pool_size: int = 8,
+                 idle_timeout: float = 30.0, response_format: str = DEFAULT_RESPONSE_FORMAT):
+        self.base_url = base_url
+        self.response_format = response_format
+        self.transport = AsyncPooledHTTPTransport(base_url, pool_size=pool_size, idle_timeout=idle_timeout)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self) -> None:
+        """Cerrar las conexiones del pool"""
+        await self.transport.close()
+
+    async def _request(self, path: str, payload: dict = None, timeout: float = 10) -> dict:
+        """Enviar una petición (POST si hay payload) y formatear la respuesta"""
+        endpoint = f"{self.base_url}{path}"
+        try:
+            method, data, headers = encode_request(payload, self.response_format)
+            status, response_headers, body = await self.transport.request(method, path, data, headers, timeout)
+            return decode_response(status, response_headers, body, endpoint)
+        except Exception as e:
+            return error_response(e, endpoint)
+
+    async def query(self, text: str, source: str = "TECCIA-Z-Client") -> dict:
+        """Enviar consulta a ORUS"""
+        return await self._request("/query", {"text": text, "source": source}, timeout=10)
+
+    async def health_check(self) -> dict:
+        """Verificar salud del sistema ORUS"""
+        return await self._request("/health", timeout=5)
+
+    async def get_time(self) -> dict:
+        """Obtener hora actual del servidor ORUS"""
+        return await self._request("/time", timeout=5)
+
+    async def get_logs_analysis(self) -> dict:
+        """Obtener análisis de logs del sistema ORUS"""
+        return await self._request("/logs", timeout=10)
+
+    async def query_many(self, texts: Iterable[str], source: str = "TECCIA-Z-Batch",
+                         concurrency: int = 8) -> List[dict]:
+        """
+        Enviar muchas consultas en paralelo
+
+        Solo hay `concurrency` consultas en vuelo a la vez y los textos se
+        consumen del iterable a medida que se liberan workers, por lo que no
+        se crean miles de tareas de golpe.
+
+        Args:
+            texts: Textos a consultar (cualquier iterable)
+            source: Origen de las consultas
+            concurrency: Consultas simultáneas máximas
+
+        Returns:
+            Respuestas en el mismo orden que `texts`
+        """
+        pending = enumerate(texts)
+        results = {}
+
+        async def worker():
+            for index, text in pending:
+                results[index] = await self.query(text, source)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        return [results[index] for index in range(len(results))]
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] != "batch":
+        print("🔍 TECCIA-Z ORUS API Client - Async Version")
+        print("=" * 50)
+        print("Uso:")
+        print("  python3 orus_async_client.py batch <archivo|-> [concurrencia]")
+        print("")
+        print("Envía una consulta por línea del archivo (o stdin con '-')")
+        print("y escribe las respuestas como JSON, una por línea, en orden.")
+        print("")
+        print("Ejemplos:")
+        print("  python3 orus_async_client.py batch consultas.txt 16")
+        print("  cat consultas.txt | python3 orus_async_client.py batch -")
+        print("=" * 50)
+        sys.exit(1)
+
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    if sys.argv[2] == "-":
+        texts = [line.strip() for line in sys.stdin if line.strip()]
+    else:
+        with open(sys.argv[2], encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+
+    async def run():
+        async with AsyncORUSAPIClient(pool_size=concurrency) as client:
+            return await client.query_many(texts, "TECCIA-Z-Batch-CLI", concurrency=concurrency)
+
+    for response in asyncio.run(run()):
+        print(json.dumps(response, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+ORUS Client - Transportes asíncronos
+Conexión HTTP/1.1 keep-alive sobre asyncio streams y pool asíncrono con backpressure
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from .transports import STALE_CONNECTION_ERRORS
+
+class AsyncHTTPConnection:
+    """Conexión HTTP/1.1 keep-alive mínima sobre asyncio streams"""
+
+    def __init__(self, host: str, port: int, ssl: bool = False):
+        self.host = host
+        self.port = port
+        self.ssl = ssl
+        self.reader = None
+        self.writer = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+
+    async def request(self, method: str, path: str, body: Optional[bytes] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Enviar una petición y leer la respuesta completa
+
+        Returns:
+            Tupla (status, cabeceras en minúsculas, cuerpo de la respuesta)
+        """
+        if not self.is_open:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl or None)
+
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+        ]
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Conexión cerrada por el servidor")
+        status = int(status_line.split()[1])
+
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            payload = await self._read_chunked()
+        else:
+            payload = await self.reader.readexactly(int(response_headers.get("content-length", "0")))
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+
+        return status, response_headers, payload
+
+    async def _read_chunked(self) -> bytes:
+        """Leer un cuerpo con Transfer-Encoding: chunked"""
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readline()
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+
+    async def close(self) -> None:
+        """Cerrar la conexión"""
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+        self.reader = self.writer = None
+
+class AsyncPooledHTTPTransport:
+    """
+    Pool de conexiones keep-alive asíncrono
+
+    Como máximo `pool_size` peticiones usan una conexión a la vez; el resto
+    espera a que se libere una (backpressure). Las conexiones en reposo más
+    de `idle_timeout` segundos se cierran.
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 8, idle_timeout: float = 30.0,
+                 timeout: float = 10.0, **options):
+        """
+        Inicializar el transporte
+
+        Args:
+            base_url: URL base del servidor (http:// o https://)
+            pool_size: Conexiones simultáneas máximas
+            idle_timeout: Segundos tras los que se descarta una conexión en reposo
+            timeout: Timeout por defecto de cada petición
+        """
+        parsed = urlparse(base_url)
+        self.ssl = parsed.scheme == "https"
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if self.ssl else 80)
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle = deque()  # (conexión, último uso)
+        self._slots = None
+        self.connections_created = 0
+
+    def _acquire(self) -> Tuple[AsyncHTTPConnection, bool]:
+        """Obtener una conexión en reposo vigente o crear una nueva"""
+        now = time.monotonic()
+        while self._idle:
+            connection, last_used = self._idle.pop()
+            if connection.is_open and now - last_used <= self.idle_timeout:
+                return connection, True
+            self._close_later(connection)
+        self.connections_created += 1
+        return AsyncHTTPConnection(self.host, self.port, ssl=self.ssl), False
+
+    def _close_later(self, connection: AsyncHTTPConnection) -> None:
+        """Cerrar una conexión sin bloquear al llamador"""
+        asyncio.ensure_future(connection.close())
+
+    async def request(self, method: str, path: str, body: Optional[bytes] = None,
+                      headers: Optional[Dict[str, str]] = None,
+                      timeout: Optional[float] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Enviar una petición HTTP usando el pool
+
+        Args:
+            method: Método HTTP
+            path: Ruta de la petición
+            body: Cuerpo de la petición
+            headers: Cabeceras adicionales
+            timeout: Timeout de la petición (por defecto el del transporte)
+
+        Returns:
+            Tupla (status, cabeceras en minúsculas, cuerpo de la respuesta)
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+        timeout = timeout or self.timeout
+
+        async with self._slots:
+            for attempt in range(2):
+                connection, reused = self._acquire()
+                try:
+                    result = await asyncio.wait_for(connection.request(method, path, body, headers), timeout)
+                except STALE_CONNECTION_ERRORS + (asyncio.IncompleteReadError,):
+                    await connection.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    await connection.close()
+                    raise
+
+                if connection.is_open:
+                    self._idle.append((connection, time.monotonic()))
+                return result
+
+    async def close(self) -> None:
+        """Cerrar todas las conexiones en reposo"""
+        while self._idle:
+            connection, _ = self._idle.pop()
+            await connection.close()
@@ -0,0 +1,109 @@
+"""
+ORUS Client - Caché de respuestas
+Caché LRU con TTL por entrada para respuestas de consultas ORUS
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+def make_query_key(text: str, source: str = "") -> Tuple[str, str]:
+    """
+    Clave normalizada de una consulta
+
+    Ignora mayúsculas y diferencias de espacios en el texto, de modo que
+    "ORUS,  estado" y "orus, estado" comparten entrada.
+    """
+    return " ".join((text or "").split()).casefold(), (source or "").strip()
+
+class TTLLRUCache:
+    """
+    Caché acotada con expulsión LRU y caducidad por entrada
+
+    Segura entre hilos. Lleva contadores de aciertos, fallos, caducadas y
+    expulsiones para medir su efectividad.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        """
+        Inicializar la caché
+
+        Args:
+            max_size: Número máximo de entradas (0 desactiva la caché)
+            ttl: Segundos de vida por defecto de cada entrada
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()  # clave -> (valor, caduca_en)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Devolver el valor en caché o None si no existe o caducó"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Guardar un valor, expulsando el menos usado si se supera el tamaño"""
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> int:
+        """
+        Invalidar una entrada o toda la caché
+
+        Args:
+            key: Clave a invalidar (None vacía la caché)
+
+        Returns:
+            Número de entradas eliminadas
+        """
+        with self._lock:
+            if key is None:
+                removed = len(self._data)
+                self._data.clear()
+                return removed
+            return 1 if self._data.pop(key, None) is not None else 0
+
+    def stats(self) -> dict:
+        """Contadores de uso de la caché"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
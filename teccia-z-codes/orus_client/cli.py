@@ -0,0 +1,151 @@
+"""
+ORUS Client - Línea de comandos
+Lógica compartida por los scripts orus-api-client*.py
+
+La CLI se invoca miles de veces al día desde cron y sondas de monitorización,
+así que el arranque solo importa lo imprescindible: si hay un daemon
+(`<script> daemon`) la petición se delega por socket Unix a un proceso ya
+caliente, y el cliente HTTP solo se importa cuando no lo hay.
+Comprobar el presupuesto de arranque con benchmark_client_startup.py.
+"""
+
+import os
+import sys
+
+# Comandos disponibles: nombre -> (descripción, método del cliente, título de la respuesta)
+COMMANDS = {
+    "health": ("Verificar salud de ORUS", "health_check", "Health Check de ORUS"),
+    "status": ("Estado completo del sistema", "get_system_status", "Estado Completo del Sistema"),
+    "containers": ("Estado de contenedores", "get_containers_status", "Estado de Contenedores"),
+    "agents": ("Información de agentes", "get_agents_info", "Información de Agentes"),
+    "workspaces": ("Workspaces de AnythingLLM", "get_workspaces", "Workspaces de AnythingLLM"),
+    "time": ("Hora actual del servidor", "get_time", "Hora del Servidor ORUS"),
+    "logs": ("Análisis de logs del sistema", "get_logs_analysis", "Análisis de Logs ORUS"),
+}
+
+def print_response(response: dict, title: str = "Response"):
+    """Formatear respuesta para mostrar"""
+    print("\n" + "=" * 50)
+    print("🔍 " + title)
+    print("=" * 50)
+
+    if response["success"]:
+        print("✅ Éxito: " + str(response['status_code']))
+        if "data" in response and isinstance(response["data"], dict):
+            data = response["data"]
+
+            if "message" in data:
+                print("📄 Mensaje: " + data['message'])
+            elif "errors_found" in data:
+                print(f"🚨 Errores encontrados: {data.get('total_errors', 0)}")
+                if data["errors_found"]:
+                    for error in data["errors_found"]:
+                        print(f"   • {error}")
+                else:
+                    print("   ✅ No se detectaron errores")
+
+                if data.get("analyzed_files"):
+                    print(f"📁 Archivos analizados: {', '.join(data['analyzed_files'])}")
+
+                if data.get("skipped_files"):
+                    print(f"⚠️  Archivos omitidos: {', '.join(data['skipped_files'])}")
+            else:
+                import json
+                print("📄 Datos: " + json.dumps(data, indent=2, ensure_ascii=False))
+    else:
+        print("❌ Error: " + response.get('error', 'Unknown error'))
+        if "status_code" in response:
+            print("📊 Status Code: " + str(response['status_code']))
+
+    print("🕐 Timestamp: " + response['timestamp'])
+    print("🌐 Endpoint: " + response['endpoint'])
+    print("=" * 50)
+
+def print_usage(prog, title, commands, examples) -> None:
+    """Mostrar la ayuda del script"""
+    print("🔍 " + title)
+    print("=" * 50)
+    print("Uso:")
+    print(f"  python3 {prog} <comando>")
+    print("")
+    print("Comandos disponibles:")
+    for name in commands:
+        print(f"  {name:<15} - {COMMANDS[name][0]}")
+    print(f"  {'query <texto>':<15} - Enviar consulta personalizada")
+    print(f"  {'watch [s] [v]':<15} - Sondear /health y /time cada s segundos (percentiles en ventana de v s)")
+    print(f"  {'daemon':<15} - Mantener un cliente caliente para las siguientes invocaciones")
+    print("")
+    print("Ejemplos:")
+    for example in examples:
+        print(f"  python3 {prog} {example}")
+    print("=" * 50)
+
+def run_command(base_url: str, method: str, args: tuple = (), client_options=None) -> dict:
+    """
+    Ejecutar un método del cliente, en el daemon si está arrancado
+
+    ORUS_CLIENT_DAEMON=0 fuerza la ejecución en el propio proceso.
+    """
+    if os.environ.get("ORUS_CLIENT_DAEMON", "1") != "0":
+        from .daemon import call_daemon
+        try:
+            return call_daemon(base_url, method, args)
+        except (OSError, EOFError, ValueError, TypeError, RuntimeError):
+            pass  # sin daemon, respuesta malformada o rechazada: ejecutar en el proceso
+
+    from .client import ORUSAPIClient
+
+    with ORUSAPIClient(base_url, **(client_options or {})) as client:
+        return getattr(client, method)(*args)
+
+def run_cli(prog: str, title: str, commands, examples, base_url: str, query_source: str,
+            argv=None, client_options=None) -> None:
+    """
+    Ejecutar un script cliente
+
+    Args:
+        prog: Nombre del script (para la ayuda)
+        title: Título mostrado en la ayuda
+        commands: Comandos de COMMANDS que admite el script (además de query, watch y daemon)
+        examples: Argumentos de ejemplo para la ayuda
+        base_url: URL del servidor ORUS
+        query_source: Origen de las consultas personalizadas
+        argv: Argumentos (por defecto sys.argv[1:])
+        client_options: Opciones adicionales para ORUSAPIClient
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print_usage(prog, title, commands, examples)
+        sys.exit(1)
+
+    command = argv[0]
+    if command == "daemon":
+        from .daemon import serve_daemon
+        serve_daemon(client_options=client_options)
+        return
+
+    if command == "watch":
+        from .watch import parse_watch_args, watch
+        try:
+            options = parse_watch_args(argv[1:])
+        except ValueError:
+            print(f"Uso: python3 {prog} watch [intervalo_s] [ventana_s]")
+            sys.exit(1)
+        watch(base_url, **options)
+        return
+
+    if command != "query" and command not in commands:
+        print("❌ Comando desconocido: " + command)
+        sys.exit(1)
+
+    if command == "query":
+        if len(argv) < 2:
+            print("❌ Error: Debes proporcionar un texto para la consulta")
+            print(f"Uso: python3 {prog} query '<texto>'")
+            sys.exit(1)
+        query_text = " ".join(argv[1:])
+        response = run_command(base_url, "query", (query_text, query_source), client_options)
+        print_response(response, "Consulta: '" + query_text + "'")
+    else:
+        _, method, response_title = COMMANDS[command]
+        print_response(run_command(base_url, method, (), client_options), response_title)
@@ -0,0 +1,215 @@
+"""
+ORUS Client - Cliente síncrono
+Cliente ORUS único sobre transportes intercambiables, con reintentos y caché de consultas
+"""
+
+import copy
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .cache import TTLLRUCache, make_query_key
+from .defaults import PRODUCTION_BASE_URL, USER_AGENT
+from .resilience import CircuitBreaker, RetryPolicy, call_with_retry
+from .transports import create_transport
+
+# Decodificador JSON rápido (opcional: pip install orjson)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Formato binario compacto (opcional: pip install msgpack)
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Cabecera Accept de cada formato de respuesta; con msgpack se acepta también
+# JSON por si el servidor no ofrece el formato binario
+ACCEPT_HEADERS = {
+    "json": "application/json",
+    "msgpack": "application/msgpack, application/json;q=0.9",
+}
+DEFAULT_RESPONSE_FORMAT = "msgpack" if MSGPACK_AVAILABLE else "json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+def decode_response(status: int, headers, body: bytes, endpoint: str) -> Dict[str, Any]:
+    """
+    Convertir una respuesta HTTP en el diccionario de resultado de los clientes
+
+    Es la única ruta de decodificación: el cuerpo msgpack o JSON se
+    decodifica directamente desde bytes (JSON con orjson si está instalado).
+
+    Args:
+        status: Código HTTP
+        headers: Cabeceras (HTTPMessage o dict con claves en minúscula)
+        body: Cuerpo de la respuesta
+        endpoint: URL completa de la petición
+    """
+    content_type = headers.get('content-type', '') or ''
+    if content_type.startswith('application/json'):
+        data = orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+    elif content_type.startswith(MSGPACK_MEDIA_TYPES):
+        data = msgpack.unpackb(body, raw=False)
+    else:
+        data = body.decode('utf-8')
+
+    return {
+        "success": status == 200,
+        "status_code": status,
+        "data": data,
+        "timestamp": datetime.now().isoformat(),
+        "endpoint": endpoint
+    }
+
+def error_response(error: Exception, endpoint: str) -> Dict[str, Any]:
+    """Resultado de una petición que no obtuvo respuesta"""
+    return {
+        "success": False,
+        "error": str(error) or type(error).__name__,
+        "timestamp": datetime.now().isoformat(),
+        "endpoint": endpoint
+    }
+
+def encode_request(payload: Optional[dict], response_format: str = DEFAULT_RESPONSE_FORMAT):
+    """Método, cuerpo y cabeceras de una petición (POST si hay payload)"""
+    headers = {'User-Agent': USER_AGENT, 'Accept': ACCEPT_HEADERS[response_format]}
+    if payload is None:
+        return "GET", None, headers
+    headers['Content-Type'] = 'application/json'
+    body = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode('utf-8')
+    return "POST", body, headers
+
+class ORUSAPIClient:
+    """Cliente ORUS síncrono sobre un transporte intercambiable ("pooled" o "urllib")"""
+
+    def __init__(self, base_url: str = PRODUCTION_BASE_URL, transport: Any = "pooled",
+                 pool_size: int = 4, idle_timeout: float = 30.0, connect_timeout: float = 3.0,
+                 max_attempts: int = 3, total_timeout: Optional[float] = None,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 cache_size: int = 256, cache_ttl: float = 30.0,
+                 response_format: str = DEFAULT_RESPONSE_FORMAT):
+        """
+        Args:
+            base_url: URL base del servidor ORUS
+            transport: Nombre del transporte o instancia con request()/close()
+            pool_size: Conexiones keep-alive del transporte "pooled"
+            idle_timeout: Segundos antes de descartar una conexión inactiva
+            connect_timeout: Timeout de conexión (el de lectura va por petición)
+            max_attempts: Intentos por petición ante errores transitorios
+            total_timeout: Segundos máximos por petición, reintentos incluidos
+                (por defecto, el timeout de lectura de cada petición)
+            failure_threshold: Fallos consecutivos que abren el circuit breaker
+            reset_timeout: Segundos con el circuito abierto antes de reintentar
+            cache_size: Consultas en caché (0 la desactiva)
+            cache_ttl: Segundos de validez de cada consulta en caché
+            response_format: "msgpack" (por defecto si está instalado) o "json"
+        """
+        if response_format not in ACCEPT_HEADERS:
+            raise ValueError(f"Formato de respuesta desconocido: {response_format}")
+        if response_format == "msgpack" and not MSGPACK_AVAILABLE:
+            raise ValueError("El formato msgpack requiere el paquete msgpack")
+        self.base_url = base_url
+        self.response_format = response_format
+        self.connect_timeout = connect_timeout
+        if isinstance(transport, str):
+            transport = create_transport(transport, base_url, pool_size=pool_size, idle_timeout=idle_timeout)
+        self.transport = transport
+        # Reintentos con backoff y fallo rápido tras errores consecutivos
+        self.retry_policy = RetryPolicy(max_attempts=max_attempts, total_timeout=total_timeout)
+        self.circuit_breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        # Memoización de consultas repetidas
+        self.cache = TTLLRUCache(cache_size, cache_ttl) if cache_size > 0 else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """Cerrar las conexiones del transporte"""
+        self.transport.close()
+
+    def _request(self, path: str, payload: dict = None, timeout: float = 10) -> Dict[str, Any]:
+        """
+        Enviar una petición (POST si hay payload) y formatear la respuesta
+
+        `timeout` es el timeout de lectura; el de conexión es `connect_timeout`.
+        Los reintentos comparten un único presupuesto (`total_timeout`, o
+        `timeout` si no se indicó): cada intento usa como mucho el tiempo que
+        queda, así que un servidor que no responde no multiplica la latencia.
+        """
+        endpoint = f"{self.base_url}{path}"
+        try:
+            method, data, headers = encode_request(payload, self.response_format)
+            budget = self.retry_policy.total_timeout or timeout
+            deadline = time.monotonic() + budget
+
+            def send():
+                remaining = max(0.001, deadline - time.monotonic())
+                return self.transport.request(method, path, data, headers, min(timeout, remaining),
+                                              min(self.connect_timeout, remaining))
+
+            status, response_headers, body = call_with_retry(
+                send, self.retry_policy, self.circuit_breaker, total_timeout=budget
+            )
+            return decode_response(status, response_headers, body, endpoint)
+        except Exception as e:
+            return error_response(e, endpoint)
+
+    def query(self, text: str, source: str = "TECCIA-Z-Client", use_cache: bool = True) -> Dict[str, Any]:
+        """Enviar consulta a ORUS (las respuestas correctas se guardan en caché; se devuelven copias)"""
+        cache_key = make_query_key(text, source) if self.cache is not None and use_cache else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        result = self._request("/query", {"text": text, "source": source}, timeout=10)
+        if cache_key is not None and result["success"]:
+            # Copias: modificar una respuesta no altera la entrada en caché
+            self.cache.set(cache_key, copy.deepcopy(result))
+        return result
+
+    def invalidate_cache(self, text: Optional[str] = None, source: str = "TECCIA-Z-Client") -> int:
+        """Invalidar una consulta en caché (o toda la caché si no se indica texto)"""
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(make_query_key(text, source) if text is not None else None)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Aciertos, fallos y tamaño de la caché de consultas"""
+        return self.cache.stats() if self.cache is not None else {"enabled": False}
+
+    def health_check(self) -> Dict[str, Any]:
+        """Verificar salud del sistema ORUS"""
+        return self._request("/health", timeout=5)
+
+    def get_time(self) -> Dict[str, Any]:
+        """Obtener hora actual del servidor ORUS"""
+        return self._request("/time", timeout=5)
+
+    def get_logs_analysis(self) -> Dict[str, Any]:
+        """Obtener análisis de logs del sistema ORUS"""
+        return self._request("/logs", timeout=10)
+
+    def get_system_status(self) -> Dict[str, Any]:
+        """Obtener estado completo del sistema"""
+        return self.query("ORUS, estado del sistema completo", "TECCIA-Z-System-Status")
+
+    def get_containers_status(self) -> Dict[str, Any]:
+        """Obtener estado de contenedores"""
+        return self.query("ORUS, qué contenedores están activos", "TECCIA-Z-Container-Status")
+
+    def get_agents_info(self) -> Dict[str, Any]:
+        """Obtener información de agentes"""
+        return self.query("ORUS, dame información de los agentes del sistema", "TECCIA-Z-Agent-Info")
+
+    def get_workspaces(self) -> Dict[str, Any]:
+        """Obtener workspaces de AnythingLLM a través de ORUS"""
+        return self.query("ORUS, lista todos los workspaces de AnythingLLM", "TECCIA-Z-Workspaces")
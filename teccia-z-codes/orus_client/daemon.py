@@ -0,0 +1,150 @@
+"""
+ORUS Client - Daemon de la CLI
+Proceso persistente que mantiene clientes ORUS calientes (pool keep-alive,
+caché y circuit breaker) y atiende a la CLI a través de un socket Unix
+"""
+
+# El lado cliente (call_daemon) se ejecuta en cada invocación de la CLI, por
+# lo que solo usa módulos incorporados al intérprete: _socket en lugar de
+# socket (que importa enum/selectors) y marshal en lugar de json. El socket
+# se crea con permisos 0600, así que solo el propio usuario puede hablar con
+# el daemon; y como sin XDG_RUNTIME_DIR (cron) vive en /tmp, antes de
+# conectar se comprueba que pertenece al usuario, para no fiarse de un
+# socket creado por otro usuario en esa ruta.
+import _socket
+import marshal
+import os
+import stat
+
+from .defaults import DAEMON_SOCKET
+
+# Métodos de ORUSAPIClient que el daemon acepta ejecutar
+ALLOWED_METHODS = frozenset({
+    "query", "health_check", "get_time", "get_logs_analysis", "get_system_status",
+    "get_containers_status", "get_agents_info", "get_workspaces", "cache_stats",
+})
+
+# Timeout del lado cliente: cubre los reintentos con backoff del daemon
+CALL_TIMEOUT = 60.0
+
+def _recv_all(sock) -> bytes:
+    """Leer del socket hasta que el otro extremo cierre la escritura"""
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+def check_socket_owner(socket_path: str) -> None:
+    """
+    Comprobar que `socket_path` es un socket del propio usuario sin permisos para otros
+
+    Raises:
+        FileNotFoundError: Si no existe
+        PermissionError: Si no es un socket, es de otro usuario o lo pueden usar otros
+    """
+    info = os.lstat(socket_path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"Socket del daemon no fiable (otro propietario o permisos abiertos): {socket_path}")
+
+def call_daemon(base_url: str, method: str, args: tuple = (), socket_path: str = DAEMON_SOCKET,
+                timeout: float = CALL_TIMEOUT) -> dict:
+    """
+    Ejecutar un método del cliente en el daemon
+
+    Raises:
+        OSError: Si el daemon no está arrancado, no responde o el socket no es del usuario
+        EOFError, ValueError, TypeError: Si la respuesta está vacía o malformada
+        RuntimeError: Si el daemon rechaza la petición
+    """
+    check_socket_owner(socket_path)
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(marshal.dumps((base_url, method, tuple(args))))
+        sock.shutdown(_socket.SHUT_WR)
+        ok, result = marshal.loads(_recv_all(sock))
+    finally:
+        sock.close()
+
+    if not ok:
+        raise RuntimeError(result)
+    return result
+
+def serve_daemon(socket_path: str = DAEMON_SOCKET, client_options: dict = None) -> None:
+    """
+    Atender peticiones de la CLI hasta recibir SIGINT/SIGTERM
+
+    Se crea un ORUSAPIClient por URL base y se reutiliza entre peticiones,
+    de modo que las conexiones keep-alive, la caché de consultas y el estado
+    del circuit breaker sobreviven entre invocaciones de la CLI.
+
+    Args:
+        socket_path: Ruta del socket Unix
+        client_options: Opciones para cada ORUSAPIClient
+    """
+    import signal
+    import socketserver
+    import threading
+
+    from .client import ORUSAPIClient
+
+    clients = {}
+    clients_lock = threading.Lock()
+
+    def get_client(base_url: str) -> ORUSAPIClient:
+        with clients_lock:
+            if base_url not in clients:
+                clients[base_url] = ORUSAPIClient(base_url, **(client_options or {}))
+            return clients[base_url]
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            try:
+                base_url, method, args = marshal.loads(_recv_all(self.request))
+                if method == "ping":
+                    reply = (True, os.getpid())
+                elif method not in ALLOWED_METHODS:
+                    raise ValueError(f"Método no permitido: {method}")
+                else:
+                    reply = (True, getattr(get_client(base_url), method)(*args))
+            except Exception as e:
+                reply = (False, f"{type(e).__name__}: {e}")
+            self.request.sendall(marshal.dumps(reply))
+
+    if os.path.lexists(socket_path):
+        try:
+            check_socket_owner(socket_path)
+        except PermissionError as e:
+            raise SystemExit(f"❌ {e}; bórrelo o use ORUS_CLIENT_SOCKET") from None
+        try:
+            pid = call_daemon("", "ping", socket_path=socket_path, timeout=1.0)
+        except (OSError, EOFError, ValueError, TypeError):
+            os.unlink(socket_path)  # socket huérfano de un daemon anterior
+        else:
+            raise SystemExit(f"❌ Ya hay un daemon (PID {pid}) escuchando en {socket_path}")
+
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+
+    def shutdown(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    print(f"🚀 Daemon ORUS escuchando en {socket_path} (PID {os.getpid()})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+        for client in clients.values():
+            client.close()
+        print("🛑 Daemon ORUS detenido")
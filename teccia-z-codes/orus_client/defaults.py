@@ -0,0 +1,16 @@
+"""
+ORUS Client - Valores por defecto
+Constantes compartidas sin dependencias (se importan en el arranque de la CLI)
+"""
+
+import os
+
+PRODUCTION_BASE_URL = "http://188.245.56.151:8085"
+LOCAL_BASE_URL = "http://127.0.0.1:8085"
+
+USER_AGENT = "TECCIA-Z-API-Client/1.0"
+
+# Socket Unix del daemon de la CLI (ORUS_CLIENT_SOCKET lo sobrescribe)
+DAEMON_SOCKET = os.environ.get("ORUS_CLIENT_SOCKET") or os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR", "/tmp"), f"orus-client-{os.getuid()}.sock"
+)
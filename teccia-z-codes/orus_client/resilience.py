@@ -0,0 +1,148 @@
+"""
+ORUS Client - Resiliencia
+Reintentos con backoff exponencial y circuit breaker para los clientes ORUS
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+class CircuitOpenError(Exception):
+    """El circuito está abierto: se falla rápido sin contactar con el servidor"""
+
+class CircuitBreaker:
+    """
+    Circuit breaker de tres estados (closed, open, half_open)
+
+    Tras `failure_threshold` fallos consecutivos el circuito se abre y las
+    llamadas fallan de inmediato. Pasados `reset_timeout` segundos se deja
+    pasar una llamada de prueba: si funciona se cierra, si falla se reabre.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Indicar si se puede intentar una llamada ahora"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_progress = False
+            if self.state == self.HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Registrar una llamada correcta"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Registrar una llamada fallida"""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_progress = False
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def retry_after(self) -> float:
+        """Segundos hasta la próxima llamada de prueba (0 si no está abierto)"""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+class RetryPolicy:
+    """
+    Política de reintentos con backoff exponencial y jitter completo
+
+    El retardo antes del reintento n es aleatorio en [0, min(max_delay,
+    base_delay * 2^n)]. `total_timeout` limita el tiempo total dedicado a
+    una llamada, reintentos incluidos.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 5.0,
+                 total_timeout: Optional[float] = None,
+                 retry_statuses: Tuple[int, ...] = (502, 503, 504)):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.total_timeout = total_timeout
+        self.retry_statuses = retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Retardo antes del reintento número `attempt` (empezando en 0)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+def call_with_retry(send: Callable[[], tuple], policy: RetryPolicy,
+                    breaker: Optional[CircuitBreaker] = None,
+                    sleep: Callable[[float], None] = time.sleep,
+                    total_timeout: Optional[float] = None) -> tuple:
+    """
+    Ejecutar una petición aplicando reintentos y circuit breaker
+
+    Args:
+        send: Función que envía la petición y devuelve (status, cabeceras, cuerpo)
+        policy: Política de reintentos
+        breaker: Circuit breaker compartido (opcional)
+        sleep: Función de espera (inyectable para pruebas)
+        total_timeout: Presupuesto de esta llamada (por defecto policy.total_timeout)
+
+    Returns:
+        Resultado de `send` (el último si todos los intentos devolvieron un
+        status reintentable)
+
+    Raises:
+        CircuitOpenError: Si el circuito está abierto
+        Exception: La última excepción de `send` si se agotan los intentos
+    """
+    started = time.monotonic()
+    total_timeout = policy.total_timeout if total_timeout is None else total_timeout
+
+    for attempt in range(policy.max_attempts):
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"Circuito abierto, reintentar en {breaker.retry_after():.1f}s")
+
+        error, result = None, None
+        try:
+            result = send()
+        except Exception as e:
+            error = e
+
+        if error is None and result[0] not in policy.retry_statuses:
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+        if breaker is not None:
+            breaker.record_failure()
+
+        delay = policy.backoff(attempt)
+        last_attempt = attempt == policy.max_attempts - 1
+        out_of_time = (
+            total_timeout is not None
+            and time.monotonic() - started + delay >= total_timeout
+        )
+        if last_attempt or out_of_time:
+            if error is not None:
+                raise error
+            return result
+
+        sleep(delay)
@@ -0,0 +1,209 @@
+"""
+ORUS Client - Transportes HTTP
+Transportes síncronos intercambiables: urllib y pool keep-alive (http.client)
+"""
+
+import http.client
+import threading
+import time
+from collections import deque
+from http.client import HTTPMessage
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# Errores que indican que una conexión reutilizada fue cerrada por el servidor
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+class UrllibTransport:
+    """Transporte sin estado sobre urllib (abre una conexión por petición)"""
+
+    def __init__(self, base_url: str, timeout: float = 10.0, **options):
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None,
+                connect_timeout: Optional[float] = None) -> Tuple[int, HTTPMessage, bytes]:
+        """
+        Enviar una petición HTTP
+
+        urllib no distingue timeout de conexión y de lectura, por lo que
+        `connect_timeout` se ignora.
+
+        Returns:
+            Tupla (status, cabeceras, cuerpo de la respuesta)
+        """
+        import urllib.error
+        import urllib.request
+
+        req = urllib.request.Request(f"{self.base_url}{path}", data=body, headers=headers or {}, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout or self.timeout) as response:
+                return response.getcode(), response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def close(self) -> None:
+        """Sin conexiones persistentes que cerrar"""
+
+class PooledHTTPTransport:
+    """
+    Transporte HTTP con conexiones persistentes reutilizables
+
+    Mantiene hasta `pool_size` conexiones abiertas en reposo y cierra las que
+    llevan más de `idle_timeout` segundos sin usarse. Si una conexión
+    reutilizada resulta estar cerrada por el servidor, la petición se repite
+    una vez con una conexión nueva.
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 4, idle_timeout: float = 30.0,
+                 timeout: float = 10.0, connect_timeout: Optional[float] = None, **options):
+        """
+        Inicializar el transporte
+
+        Args:
+            base_url: URL base del servidor (http:// o https://)
+            pool_size: Máximo de conexiones en reposo a conservar
+            idle_timeout: Segundos tras los que se descarta una conexión en reposo
+            timeout: Timeout de lectura por defecto de cada petición
+            connect_timeout: Timeout de conexión TCP (por defecto igual a `timeout`)
+        """
+        parsed = urlparse(base_url)
+        self.scheme = parsed.scheme or "http"
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if self.scheme == "https" else 80)
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self._idle = deque()  # (conexión, último uso)
+        self._lock = threading.Lock()
+        self.connections_created = 0
+
+    def _new_connection(self, connect_timeout: float) -> http.client.HTTPConnection:
+        """Abrir una conexión nueva respetando el timeout de conexión"""
+        self.connections_created += 1
+        if self.scheme == "https":
+            connection = http.client.HTTPSConnection(self.host, self.port, timeout=connect_timeout)
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=connect_timeout)
+        connection.connect()
+        return connection
+
+    def _acquire(self, timeout: float, connect_timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Obtener una conexión del pool o crear una nueva
+
+        Returns:
+            Tupla (conexión, reutilizada)
+        """
+        now = time.monotonic()
+        connection, reused = None, False
+        with self._lock:
+            while self._idle:
+                candidate, last_used = self._idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    connection, reused = candidate, True
+                    break
+                candidate.close()
+
+        if connection is None:
+            connection = self._new_connection(connect_timeout)
+
+        # Tras conectar, el socket usa el timeout de lectura
+        connection.timeout = timeout
+        connection.sock.settimeout(timeout)
+        return connection, reused
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        """Devolver una conexión al pool (o cerrarla si está lleno)"""
+        with self._lock:
+            self._evict_idle()
+            if len(self._idle) < self.pool_size:
+                self._idle.append((connection, time.monotonic()))
+                return
+        connection.close()
+
+    def _evict_idle(self) -> None:
+        """Cerrar las conexiones en reposo que superan `idle_timeout`"""
+        now = time.monotonic()
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            connection, _ = self._idle.popleft()
+            connection.close()
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None,
+                connect_timeout: Optional[float] = None) -> Tuple[int, HTTPMessage, bytes]:
+        """
+        Enviar una petición HTTP reutilizando conexiones
+
+        Args:
+            method: Método HTTP
+            path: Ruta de la petición
+            body: Cuerpo de la petición
+            headers: Cabeceras adicionales
+            timeout: Timeout de lectura (por defecto el del transporte)
+            connect_timeout: Timeout de conexión (por defecto el del transporte)
+
+        Returns:
+            Tupla (status, cabeceras, cuerpo de la respuesta)
+        """
+        timeout = timeout or self.timeout
+        connect_timeout = connect_timeout or self.connect_timeout or timeout
+        headers = dict(headers or {})
+        headers.setdefault("Connection", "keep-alive")
+
+        for attempt in range(2):
+            connection, reused = self._acquire(timeout, connect_timeout)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+
+            return response.status, response.headers, data
+
+    def close(self) -> None:
+        """Cerrar todas las conexiones en reposo"""
+        with self._lock:
+            while self._idle:
+                connection, _ = self._idle.pop()
+                connection.close()
+
+# Transportes síncronos disponibles por nombre
+TRANSPORTS = {
+    "urllib": UrllibTransport,
+    "pooled": PooledHTTPTransport,
+}
+
+def create_transport(name: str, base_url: str, **options):
+    """
+    Crear un transporte síncrono por nombre
+
+    Args:
+        name: "urllib" o "pooled"
+        base_url: URL base del servidor
+        **options: Opciones del transporte (pool_size, idle_timeout, ...)
+    """
+    if name not in TRANSPORTS:
+        raise ValueError(f"Transporte desconocido: {name} (disponibles: {', '.join(TRANSPORTS)})")
+    return TRANSPORTS[name](base_url, **options)
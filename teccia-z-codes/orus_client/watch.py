@@ -0,0 +1,208 @@
+"""
+ORUS Client - Modo watch
+Sondeo periódico de /health y /time sobre una conexión reutilizada, con
+histograma de latencias estilo HDR, percentiles móviles y tasa de errores
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from .defaults import USER_AGENT
+from .transports import PooledHTTPTransport
+
+WATCH_ENDPOINTS = ("/health", "/time")
+
+# Percentiles mostrados en cada informe
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+class LatencyHistogram:
+    """
+    Histograma de latencias log-lineal (estilo HdrHistogram)
+
+    Cada potencia de dos se divide en 2**sub_bucket_bits sub-buckets, por lo
+    que el error relativo de cualquier percentil está acotado (~3% con 6
+    bits) y la memoria es fija: no se guardan las muestras individuales.
+    Los valores se registran en microsegundos.
+    """
+
+    def __init__(self, max_value_us: int = 60_000_000, sub_bucket_bits: int = 6):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.max_value_us = max_value_us
+        self.counts = [0] * (self._index(max_value_us) + 1)
+        self.total = 0
+        self.min_us = None
+        self.max_us = 0
+        self.sum_us = 0
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return (shift << (self.sub_bucket_bits - 1)) + (value >> shift)
+
+    def _value_at(self, index: int) -> int:
+        """Límite superior de los valores que caen en el bucket `index`"""
+        if index < self.sub_bucket_count:
+            return index
+        half = self.sub_bucket_count >> 1
+        shift = (index - half) // half
+        sub_bucket = index - (shift << (self.sub_bucket_bits - 1))
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value_us: int) -> None:
+        """Registrar una latencia (se satura en max_value_us)"""
+        value_us = max(0, min(int(value_us), self.max_value_us))
+        self.counts[self._index(value_us)] += 1
+        self.total += 1
+        self.sum_us += value_us
+        self.max_us = max(self.max_us, value_us)
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Acumular otro histograma con la misma configuración"""
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+
+    def percentile(self, pct: float) -> int:
+        """Valor (µs) por debajo del cual está el `pct`% de las muestras"""
+        if not self.total:
+            return 0
+        target = max(1, -(-self.total * pct // 100))  # rango más cercano (techo)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._value_at(index), self.max_us)
+        return self.max_us
+
+    def mean(self) -> float:
+        """Latencia media en µs"""
+        return self.sum_us / self.total if self.total else 0.0
+
+class EndpointStats:
+    """Latencias y errores de un endpoint: acumulados y en una ventana móvil"""
+
+    def __init__(self, window_slots: int):
+        self.cumulative = LatencyHistogram()
+        self.slots = deque(maxlen=window_slots)  # (histograma, peticiones, errores) por informe
+        self.requests = 0
+        self.errors = 0
+        self.new_slot()
+
+    def new_slot(self) -> None:
+        self.slots.append([LatencyHistogram(), 0, 0])
+
+    def record(self, latency_us: int, ok: bool) -> None:
+        slot = self.slots[-1]
+        slot[1] += 1
+        self.requests += 1
+        if ok:
+            slot[0].record(latency_us)
+            self.cumulative.record(latency_us)
+        else:
+            slot[2] += 1
+            self.errors += 1
+
+    def window(self):
+        """(histograma, peticiones, errores) de la ventana móvil"""
+        histogram = LatencyHistogram()
+        requests = errors = 0
+        for slot_histogram, slot_requests, slot_errors in self.slots:
+            histogram.merge(slot_histogram)
+            requests += slot_requests
+            errors += slot_errors
+        return histogram, requests, errors
+
+def format_stats(name: str, histogram: LatencyHistogram, requests: int, errors: int) -> str:
+    """Línea de informe: peticiones, % de errores y percentiles en ms"""
+    error_rate = errors / requests * 100 if requests else 0.0
+    percentiles = "  ".join(
+        f"p{pct:g}={histogram.percentile(pct) / 1000:.1f}" for pct in REPORT_PERCENTILES
+    )
+    return (f"   {name:<8} n={requests:<6} err={error_rate:5.1f}%  {percentiles}  "
+            f"max={histogram.max_us / 1000:.1f} ms")
+
+def watch(base_url: str, interval: float = 5.0, window: float = 60.0, report_every: Optional[float] = None,
+          timeout: float = 5.0, max_rounds: Optional[int] = None,
+          stop_event: Optional[threading.Event] = None) -> Dict[str, EndpointStats]:
+    """
+    Sondear /health y /time cada `interval` segundos hasta Ctrl+C
+
+    Las peticiones usan una única conexión keep-alive y no se reintentan,
+    así que cada error y cada latencia cuentan tal cual para el SLO.
+
+    Args:
+        base_url: URL del servidor ORUS
+        interval: Segundos entre rondas de sondeo
+        window: Segundos que cubren los percentiles móviles
+        report_every: Segundos entre informes (por defecto, cada ronda)
+        timeout: Timeout de cada petición
+        max_rounds: Rondas máximas (None = sin límite)
+        stop_event: Evento para detener el sondeo desde otro hilo
+
+    Returns:
+        Estadísticas por endpoint
+    """
+    report_every = max(report_every or interval, interval)
+    window_slots = max(1, round(window / report_every))
+    stats = {path: EndpointStats(window_slots) for path in WATCH_ENDPOINTS}
+    transport = PooledHTTPTransport(base_url, pool_size=1, timeout=timeout)
+    headers = {'User-Agent': USER_AGENT}
+    stop_event = stop_event or threading.Event()
+
+    print(f"👀 Vigilando {base_url} cada {interval:g}s (ventana {window:g}s, Ctrl+C para salir)")
+
+    rounds = 0
+    next_report = time.monotonic() + report_every
+    try:
+        while not stop_event.is_set() and (max_rounds is None or rounds < max_rounds):
+            started_round = time.monotonic()
+            for path in WATCH_ENDPOINTS:
+                started = time.perf_counter()
+                try:
+                    status, _, _ = transport.request("GET", path, None, headers, timeout)
+                    ok = status == 200
+                except Exception:
+                    ok = False
+                stats[path].record((time.perf_counter() - started) * 1_000_000, ok)
+            rounds += 1
+
+            if time.monotonic() >= next_report or rounds == max_rounds:
+                print(f"\n🕐 {time.strftime('%H:%M:%S')} (ventana de {window:g}s)")
+                for path, endpoint_stats in stats.items():
+                    print(format_stats(path, *endpoint_stats.window()))
+                    endpoint_stats.new_slot()
+                next_report += report_every
+
+            stop_event.wait(max(0.0, interval - (time.monotonic() - started_round)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        transport.close()
+
+    print("\n📊 Resumen acumulado")
+    for path, endpoint_stats in stats.items():
+        print(format_stats(path, endpoint_stats.cumulative, endpoint_stats.requests, endpoint_stats.errors))
+    return stats
+
+def parse_watch_args(argv: List[str]) -> Dict[str, float]:
+    """`watch [intervalo] [ventana]` -> argumentos de watch()
+
+    Raises:
+        ValueError: Si algún valor no es un número positivo
+    """
+    options = {}
+    for name, value in zip(("interval", "window"), argv):
+        options[name] = float(value)
+        if options[name] <= 0:
+            raise ValueError(f"{name} debe ser positivo")
+    return options